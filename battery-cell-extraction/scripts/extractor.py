@@ -5,21 +5,193 @@ This module provides deterministic parsing and normalization functions
 for extracting battery cell specifications from PDF datasheets.
 Designed to work with the Claude Battery Cell Extraction Skill.
 
+The module is fully annotated and passes ``mypy extractor.py``, so it can
+be compiled unchanged with mypyc (``mypyc extractor.py``) where a C
+toolchain is available. Compiled functions check argument types at run
+time, so the annotations admit every input the functions accept (None
+included). The .py file remains the source of truth.
+
 Author: Yi Li
 Version: 1.0
 Last Updated: 2026-01-09
 """
 
-from typing import Dict, List, Optional, Tuple, Any, Union
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Any, Union
 import re
 import math
+import sys
+
+# Numbers echoed back in messages; int stays distinct from float so a mypyc
+# build does not render 3 as 3.0
+_Number = Union[int, float]
+
+
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+# All regular expressions are compiled once at import time so the parsers
+# below never pay the per-call lookup in the ``re`` module cache.
+#
+# Prioritized pattern lists are folded into a single anchored alternation of
+# lookaheads: ``^(?:(?=.*?P1)|(?=.*?P2)|...)`` tries each alternative over the
+# whole text in order, so the earliest alternative still wins (exactly as a
+# loop of separate ``search`` calls would) with one engine invocation. Use
+# ``.match()`` on these and ``_first_alternative`` to read the groups back.
+
+# Value/unit parsing (the scanner in _parse_value_with_unit handles the
+# common "3200mAh" shape; _RE_NUM_UNIT is only the fallback)
+_PREFIX_CHARS = '≤≥<>~±'
+_APPROX_WORDS = ('approximately', 'approx.', 'approx', 'about', 'typ.', 'typ')
+_UNIT_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz'
+                        'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                        'Ωω%°')
+_RE_NUM_UNIT = re.compile(r'([-+]?\d*\.?\d+)\s*([a-zA-ZΩω%°]*)')
+
+# Temperature ranges
+_TEMP_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Pattern 1: "min ~ max °C" or "min~max°C"
+    r'([-+]?\d+\.?\d*)\s*[°]?[CcFf]?\s*[~\-–—to]+\s*[\+]?([-+]?\d+\.?\d*)\s*[°]?[CcFf]?',
+    # Pattern 2: "min°C to max°C"
+    r'([-+]?\d+\.?\d*)\s*[°][CcFf]\s*(?:to|~|-|–)\s*[\+]?([-+]?\d+\.?\d*)\s*[°][CcFf]',
+    # Pattern 3: Simple "min to max"
+    r'([-+]?\d+\.?\d*)\s*(?:to|~)\s*[\+]?([-+]?\d+\.?\d*)',
+)]
+
+# DCIR/impedance: one combined tokenizer, consumed in a single finditer pass.
+# The generic "impedance:" value is captured in a lookahead so the number
+# stays available to the mΩ/mohm tokens that outrank it.
+_RE_DCIR_TOKENS = re.compile(
+    r'(?P<ac>ac|1\s*k\s*hz|1000\s*hz)'
+    r'|(?P<dc>dc)'
+    r'|(?P<mohm_symbol>[≤≥<>]?\s*(?P<mohm_symbol_value>[\d.]+)\s*m[Ωω])'
+    r'|(?P<mohm_text>[≤≥<>]?\s*(?P<mohm_text_value>[\d.]+)\s*mohm)'
+    r'|(?P<impedance>impedance[:\s]+(?=[≤≥<>]?\s*(?P<impedance_value>[\d.]+)))'
+    r'|(?P<soc>(?P<soc_value>\d+)\s*%\s*SOC)'
+    r'|(?P<temp>(?P<temp_value>[-+]?\d+)\s*[°]?[Cc](?![Cc]))'
+    r'|(?P<pulse>(?P<pulse_value>\d+)\s*s(?:ec)?\s*(?:pulse)?)',
+    re.IGNORECASE
+)
+# Value tokens in priority order, mapped to the group holding the number
+_DCIR_VALUE_TOKENS = (
+    ('mohm_symbol', 'mohm_symbol_value'),
+    ('mohm_text', 'mohm_text_value'),
+    ('impedance', 'impedance_value'),
+)
+
+# Capacity
+_RE_CAP_TYP = re.compile(
+    r'^(?:'
+    r'(?=.*?(?:typ\.?|typical|nom\.?|nominal)[:\s]*(?P<v1>[\d.]+)\s*(?P<u1>m?ah))'
+    r'|(?=.*?(?P<v2>[\d.]+)\s*(?P<u2>m?ah)\s*\(?typ\.?\)?)'
+    r'|(?=.*?(?P<v3>[\d.]+)\s*(?P<u3>m?ah))'  # Fallback
+    r')',
+    re.IGNORECASE | re.DOTALL
+)
+_RE_CAP_MIN = re.compile(
+    r'^(?:'
+    r'(?=.*?(?:min\.?|minimum)[:\s]*(?P<v1>[\d.]+)\s*(?P<u1>m?ah))'
+    r'|(?=.*?(?P<v2>[\d.]+)\s*(?P<u2>m?ah)\s*\(?min\.?\)?)'
+    r')',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Current ratings
+_RE_CURRENT_C_RATE = re.compile(r'([\d.]+)\s*C\b')
+_RE_CURRENT_AMP = re.compile(r'([\d.]+)\s*A\b(?!\s*h)')
+_RE_CURRENT_DURATION = re.compile(r'(?:for\s+)?(\d+)\s*s(?:ec)?')
+_RE_CURRENT_PULSE = re.compile(r'pulse|peak|burst', re.IGNORECASE)
+
+# Dimensions
+_RE_DIAMETER_MARK = re.compile(r'[Øø∅]')
+_RE_DIM_CYL = re.compile(
+    r'^(?:'
+    r'(?=.*?[Øø∅]?\s*(?P<d1>[\d.]+)\s*[x×]\s*(?P<h1>[\d.]+)\s*(?:mm)?)'
+    r'|(?=.*?(?P<d2>[\d.]+)\s*mm?\s*[x×]\s*(?P<h2>[\d.]+)\s*mm?)'
+    r')',
+    re.DOTALL
+)
+_RE_DIM_3D = re.compile(r'([\d.]+)\s*[x×*]\s*([\d.]+)\s*[x×*]\s*([\d.]+)\s*(?:mm)?')
+
+# Cycle life: one tokenizer pass; the outer group name is the token kind.
+# "cycles: N" reads N in a lookahead so N can still start another token.
+_RE_CYCLE_TOKENS = re.compile(
+    r'(?P<cycles>[≥>]?\s*(?P<cycles_value>[\d,]+)\s*(?:cycles?|times))'
+    r'|(?P<cycles_after>(?:cycles?|times)[:\s]+(?=(?P<cycles_after_value>[\d,]+)))'
+    r'|(?P<dod>(?P<dod_value>\d+)\s*%\s*DOD)'
+    r'|(?P<eol>(?:to|at)\s+(?P<eol_value>\d+)\s*%\s*(?:capacity|SOH))'
+    r'|(?P<retention>(?P<retention_value>\d+)\s*%\s*(?:remaining|retention))',
+    re.IGNORECASE
+)
+# C-rates and temperature share the bare "C" unit ("25C" is both), so each
+# is searched on its own rather than competing for text in the tokenizer
+_RE_CYCLE_C_RATES = re.compile(r'([\d.]+)\s*C\s*/\s*([\d.]+)\s*C')
+_RE_CYCLE_SINGLE_C = re.compile(r'@?\s*([\d.]+)\s*C(?!\s*/)')
+_RE_CYCLE_TEMP = re.compile(r'([-+]?\d+)\s*°?C')
+
+# Table layout detection: one pass tags every indicator. Each alternative is
+# a zero-width lookahead and they start with disjoint characters, so no
+# indicator can hide inside another's match.
+_RE_LAYOUT = re.compile(
+    r'(?=(?P<comparison>e\d+[a-z]+|model\s*[a-z]|type\s*[a-z]))'
+    r'|(?=(?P<multi_condition>'
+    r'(?:item|條項).*?(?:condition|條件).*?(?:specification|規格)))'
+    r'|(?=(?P<numbered>\b[12]\.[0-9]\s+\w+))'
+    r'|(?=(?P<indent>^\s{2,}))',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _first_alternative(match: re.Match, size: int) -> Tuple[Any, ...]:
+    """
+    Return the groups of the first alternative that took part in a match.
+
+    Args:
+        match: Match object from one of the prioritized alternation patterns
+        size: Number of capture groups in each alternative
+
+    Returns:
+        Tuple of ``size`` group values from the winning alternative
+    """
+    groups = match.groups()
+    for i in range(0, len(groups), size):
+        if groups[i] is not None:
+            return groups[i:i + size]
+    return (None,) * size
 
 
 # =============================================================================
 # UNIT CONVERSION FUNCTIONS
 # =============================================================================
 
-def normalize_units(value: Union[str, float], target_unit: str) -> Optional[float]:
+# Canonical unit names for every accepted (lowercase) spelling
+_UNIT_CANON = {
+    'mah': 'mah', 'ah': 'ah',
+    'mohm': 'mohm', 'mω': 'mohm', 'ohm': 'ohm', 'ω': 'ohm',
+    'g': 'g', 'kg': 'kg',
+}
+# Substring fallback for other spellings, per unit family and checked in
+# order (mAh before Ah)
+_UNIT_SUBSTRINGS = {
+    'capacity': (('mah', 'mah'), ('ah', 'ah')),
+    'resistance': (('mohm', 'mohm'), ('mω', 'mohm'), ('ohm', 'ohm'), ('ω', 'ohm')),
+    'weight': (('kg', 'kg'), ('g', 'g')),
+}
+_UNIT_FAMILY = {
+    'mah': 'capacity', 'ah': 'capacity',
+    'mohm': 'resistance', 'ohm': 'resistance',
+    'g': 'weight', 'kg': 'weight',
+}
+# (source, target) -> 1 to multiply by 1000, -1 to divide by 1000.
+# Division is kept exact (value / 1000, not value * 0.001).
+_UNIT_SCALE = {
+    ('mah', 'ah'): -1, ('ah', 'mah'): 1,
+    ('mohm', 'ohm'): -1, ('ohm', 'mohm'): 1,
+    ('g', 'kg'): -1, ('kg', 'g'): 1,
+}
+
+
+def normalize_units(value: Optional[Union[str, float]], target_unit: str) -> Optional[float]:
     """
     Convert battery-related values to a target unit.
 
@@ -47,62 +219,196 @@ def normalize_units(value: Union[str, float], target_unit: str) -> Optional[floa
     if value is None:
         return None
 
-    # Handle string input with embedded unit
+    # Handle string input with embedded unit (cached, datasheets repeat these)
     if isinstance(value, str):
-        # Extract numeric value and unit from string
-        parsed = _parse_value_with_unit(value)
-        if parsed is None:
-            return None
-        numeric_value, source_unit = parsed
-    else:
-        # Float input - assume it's already in a standard form
-        numeric_value = float(value)
-        source_unit = None
-
-    target_unit = target_unit.lower()
-
-    # Capacity conversions
-    if target_unit in ['ah', 'mah']:
-        if source_unit and 'mah' in source_unit.lower():
-            # Source is mAh
-            return numeric_value / 1000 if target_unit == 'ah' else numeric_value
-        elif source_unit and 'ah' in source_unit.lower():
-            # Source is Ah
-            return numeric_value * 1000 if target_unit == 'mah' else numeric_value
-        else:
-            # No source unit - assume mAh if value > 100, else Ah
-            if numeric_value > 100:
-                # Likely mAh
-                return numeric_value / 1000 if target_unit == 'ah' else numeric_value
-            else:
-                # Likely Ah
-                return numeric_value * 1000 if target_unit == 'mah' else numeric_value
-
-    # Resistance conversions
-    elif target_unit in ['mohm', 'ohm', 'mω', 'ω']:
-        if source_unit and ('mohm' in source_unit.lower() or 'mω' in source_unit):
-            # Source is mΩ
-            return numeric_value / 1000 if target_unit in ['ohm', 'ω'] else numeric_value
-        elif source_unit and ('ohm' in source_unit.lower() or 'ω' in source_unit):
-            # Source is Ω
-            return numeric_value * 1000 if target_unit in ['mohm', 'mω'] else numeric_value
-        else:
-            # No source unit - return as-is
-            return numeric_value
+        return _normalize_unit_string(value, target_unit)
 
-    # Weight conversions
-    elif target_unit in ['g', 'kg']:
-        if source_unit and 'kg' in source_unit.lower():
-            return numeric_value * 1000 if target_unit == 'g' else numeric_value
-        elif source_unit and 'g' in source_unit.lower():
-            return numeric_value / 1000 if target_unit == 'kg' else numeric_value
-        else:
+    # Float input - assume it's already in a standard form
+    return _convert_units(float(value), None, target_unit)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_unit_string(value: str, target_unit: str) -> Optional[float]:
+    """
+    Memoized string branch of normalize_units.
+
+    Args:
+        value: The value to convert, including its unit (e.g., "3200mAh")
+        target_unit: The desired output unit
+
+    Returns:
+        Converted value as float, or None if parsing fails
+    """
+    # Extract numeric value and unit from string
+    parsed = _parse_value_with_unit(value)
+    if parsed is None:
+        return None
+    numeric_value, source_unit = parsed
+    return _convert_units(numeric_value, source_unit, target_unit)
+
+
+def _convert_units(numeric_value: float, source_unit: Optional[str],
+                   target_unit: str) -> float:
+    """
+    Convert a parsed numeric value from its source unit to the target unit.
+
+    Args:
+        numeric_value: The numeric value
+        source_unit: Lowercase unit parsed from the input string, or None
+        target_unit: The desired output unit
+
+    Returns:
+        Converted value as float
+    """
+    target = _UNIT_CANON.get(target_unit.lower())
+    if target is None:
+        return numeric_value
+
+    family = _UNIT_FAMILY[target]
+    source = _canonical_unit(source_unit, family) if source_unit else None
+    if source is None:
+        if family != 'capacity':
+            # No usable source unit - return as-is
             return numeric_value
+        # No source unit - assume mAh if value > 100, else Ah
+        source = 'mah' if numeric_value > 100 else 'ah'
+
+    return _scale_units(numeric_value, source, target)
+
+
+def _scale_units(value, source: str, target: str):
+    """
+    Scale a value (float or numpy array) between two canonical units.
+
+    Args:
+        value: Value(s) expressed in the source unit
+        source: Canonical source unit (e.g., 'mah')
+        target: Canonical target unit (e.g., 'ah')
+
+    Returns:
+        Value(s) expressed in the target unit
+    """
+    step = _UNIT_SCALE.get((source, target))
+    if step == 1:
+        return value * 1000
+    if step == -1:
+        return value / 1000
+    return value
+
+
+def normalize_units_bulk(values: Sequence[float], target_unit: str,
+                         source_hint: Optional[str] = None,
+                         source_units: Optional[Sequence[str]] = None):
+    """
+    Convert many already-parsed numeric values to a target unit at once.
+
+    Vectorized counterpart of normalize_units for corpora of datasheets:
+    the unit dispatch runs once per distinct source unit instead of once
+    per value. Without a usable source unit, capacity values follow the
+    same rule as normalize_units (> 100 is taken as mAh, otherwise Ah).
+
+    Requires numpy (pip install numpy).
+
+    Args:
+        values: Numeric values to convert
+        target_unit: The desired output unit ('ah', 'mah', 'mohm', 'ohm', 'g', 'kg')
+        source_hint: Unit shared by all values (e.g., 'mAh')
+        source_units: Per-value units, parallel to ``values``; overrides
+            ``source_hint`` when given
+
+    Returns:
+        numpy array of converted values
+
+    Raises:
+        ImportError: If numpy is not installed.
+
+    Examples:
+        >>> normalize_units_bulk([3200, 5000], "ah", source_hint="mAh")
+        array([3.2, 5. ])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "numpy is required for bulk unit normalization. "
+            "Install with: pip install numpy"
+        )
+
+    array = np.asarray(values, dtype=np.float64)
+    target = _UNIT_CANON.get(target_unit.lower())
+    if target is None:
+        return array
+
+    family = _UNIT_FAMILY[target]
+
+    def convert(arr, unit):
+        source = _canonical_unit(unit, family) if unit else None
+        if source is None:
+            if family != 'capacity':
+                return arr
+            return np.where(arr > 100, _scale_units(arr, 'mah', target),
+                            _scale_units(arr, 'ah', target))
+        return _scale_units(arr, source, target)
+
+    if source_units is None:
+        return convert(array, _lower_unit(source_hint) if source_hint else None)
+
+    # Lowercase each unit once; 'mAh' and 'mah' then share a single pass
+    units = np.asarray([_lower_unit(u) if u else None for u in source_units],
+                       dtype=object)
+    result = np.empty_like(array)
+    for unit in set(units.tolist()):
+        mask = units == unit
+        result[mask] = convert(array[mask], unit)
+    return result
+
+
+def _canonical_unit(unit: str, family: str) -> Optional[str]:
+    """
+    Map a lowercase unit string to its canonical name within a unit family.
+
+    Exact spellings are a single dict lookup; anything else (e.g. 'ohms',
+    'mahr') falls back to substring matching against the target family's
+    spellings only, so a compound unit resolves the way the target expects.
+
+    Args:
+        unit: Lowercase unit string
+        family: Unit family of the conversion target ('capacity', ...)
+
+    Returns:
+        Canonical unit name, or None if the unit is not recognized as a
+        unit of that family
+    """
+    canonical = _UNIT_CANON.get(unit)
+    if canonical is not None and _UNIT_FAMILY[canonical] == family:
+        return canonical
+    for alias, name in _UNIT_SUBSTRINGS[family]:
+        if alias in unit:
+            return name
+    return None
+
+
+def _lower_unit(unit: str) -> str:
+    """
+    Lowercase a unit string, keeping megaohm distinct from milliohm.
+
+    'MΩ' would otherwise lowercase to 'mω' and be scaled as milliohms, so it
+    is kept as 'MΩ', which no unit family recognizes (the value is then
+    returned unconverted).
+
+    Args:
+        unit: Unit string as written in the datasheet
 
-    return numeric_value
+    Returns:
+        Lowercase unit, or 'MΩ' + rest for megaohm spellings
+    """
+    if unit[:1] == 'M' and unit[1:2] in ('Ω', 'ω'):
+        return 'MΩ' + unit[2:].lower()
+    return unit.lower()
 
 
-def _parse_value_with_unit(text: str) -> Optional[Tuple[float, str]]:
+@lru_cache(maxsize=4096)
+def _parse_value_with_unit(text: Optional[str]) -> Optional[Tuple[float, str]]:
     """
     Parse a string containing a numeric value and optional unit.
 
@@ -110,26 +416,51 @@ def _parse_value_with_unit(text: str) -> Optional[Tuple[float, str]]:
         text: String to parse (e.g., "3200mAh", "45 mΩ", "≤18mΩ")
 
     Returns:
-        Tuple of (numeric_value, unit_string) or None if parsing fails
+        Tuple of (numeric_value, unit_string) or None if parsing fails.
+        The unit is lowercased (megaohm stays 'MΩ') and interned
+        (e.g., 'mah', 'mω').
     """
     if not text:
         return None
 
     # Remove common prefixes like ≤, ≥, <, >, ~, approximately, etc.
-    text = re.sub(r'^[≤≥<>~±]', '', text.strip())
-    text = re.sub(r'^(approximately|approx\.?|about|typ\.?|typical)\s*', '', text,
-                  flags=re.IGNORECASE)
+    text = text.strip()
+    if text and text[0] in _PREFIX_CHARS:
+        text = text[1:]
+    head = text[:13].lower()
+    for word in _APPROX_WORDS:
+        if head.startswith(word):
+            text = text[len(word):].lstrip()
+            break
 
-    # Pattern to match number followed by optional unit
-    # Handles: 3200, 3200mAh, 3.2 Ah, 45mΩ, 0.045Ω, etc.
-    pattern = r'([-+]?\d*\.?\d+)\s*([a-zA-ZΩω%°]*)'
-    match = re.search(pattern, text)
+    # Fast path: number at the start of the string followed by an optional
+    # unit. Handles: 3200, 3200mAh, 3.2 Ah, 45mΩ, 0.045Ω, etc.
+    n = len(text)
+    i = 1 if text[:1] in ('+', '-') else 0
+    digits_start = i
+    while i < n and text[i].isdecimal():
+        i += 1
+    if i + 1 < n and text[i] == '.' and text[i + 1].isdecimal():
+        i += 2
+        while i < n and text[i].isdecimal():
+            i += 1
+    if i > digits_start:
+        j = i
+        while j < n and text[j].isspace():
+            j += 1
+        k = j
+        while k < n and text[k] in _UNIT_CHARS:
+            k += 1
+        return (float(text[:i]), sys.intern(_lower_unit(text[j:k])))
+
+    # Slow path: number somewhere later in the string
+    match = _RE_NUM_UNIT.search(text)
 
     if match:
         try:
             numeric_value = float(match.group(1))
             unit = match.group(2).strip() if match.group(2) else ''
-            return (numeric_value, unit)
+            return (numeric_value, sys.intern(_lower_unit(unit)))
         except ValueError:
             return None
 
@@ -140,7 +471,7 @@ def _parse_value_with_unit(text: str) -> Optional[Tuple[float, str]]:
 # TEMPERATURE PARSING
 # =============================================================================
 
-def parse_temperature_range(text: str) -> Dict[str, Optional[float]]:
+def parse_temperature_range(text: Optional[str]) -> Dict[str, Optional[float]]:
     """
     Extract temperature range from various text formats.
 
@@ -164,50 +495,46 @@ def parse_temperature_range(text: str) -> Dict[str, Optional[float]]:
         >>> parse_temperature_range("-20 to 60 deg C")
         {'min_c': -20.0, 'max_c': 60.0}
     """
-    result = {'min_c': None, 'max_c': None}
+    return dict(_parse_temperature_items(text))
+
+
+@lru_cache(maxsize=4096)
+def _parse_temperature_items(text: Optional[str]) -> Tuple[Tuple[str, Optional[float]], ...]:
+    """Cached body of parse_temperature_range, as immutable (key, value) pairs."""
+    result: Dict[str, Any] = {'min_c': None, 'max_c': None}
 
     if not text:
-        return result
+        return tuple(result.items())
 
     # Normalize the text
     text = text.strip()
 
-    # Pattern for temperature range with various separators
+    # Try each temperature range pattern with its own separator rules
     # Matches: -20~60, 0 to 45, -30 - +55, etc.
-    patterns = [
-        # Pattern 1: "min ~ max °C" or "min~max°C"
-        r'([-+]?\d+\.?\d*)\s*[°]?[CcFf]?\s*[~\-–—to]+\s*[\+]?([-+]?\d+\.?\d*)\s*[°]?[CcFf]?',
-        # Pattern 2: "min°C to max°C"
-        r'([-+]?\d+\.?\d*)\s*[°][CcFf]\s*(?:to|~|-|–)\s*[\+]?([-+]?\d+\.?\d*)\s*[°][CcFf]',
-        # Pattern 3: Simple "min to max"
-        r'([-+]?\d+\.?\d*)\s*(?:to|~)\s*[\+]?([-+]?\d+\.?\d*)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _TEMP_PATTERNS:
+        match = pattern.search(text)
         if match:
             try:
                 min_val = float(match.group(1))
                 max_val = float(match.group(2))
 
                 # Ensure min < max
-                if min_val > max_val:
-                    min_val, max_val = max_val, min_val
-
-                result['min_c'] = min_val
-                result['max_c'] = max_val
+                result['min_c'], result['max_c'] = (
+                    (min_val, max_val) if min_val <= max_val
+                    else (max_val, min_val)
+                )
                 break
             except (ValueError, IndexError):
                 continue
 
-    return result
+    return tuple(result.items())
 
 
 # =============================================================================
 # DCIR/IMPEDANCE PARSING
 # =============================================================================
 
-def extract_dcir_spec(text: str) -> Dict[str, Any]:
+def extract_dcir_spec(text: Optional[str]) -> Dict[str, Any]:
     """
     Parse DCIR/impedance specification with conditions.
 
@@ -232,7 +559,13 @@ def extract_dcir_spec(text: str) -> Dict[str, Any]:
         >>> extract_dcir_spec("≤18mΩ (AC 1kHz)")
         {'value_mohm': 18.0, 'frequency_hz': 1000, 'type': 'acir'}
     """
-    result = {
+    return dict(_extract_dcir_items(text))
+
+
+@lru_cache(maxsize=4096)
+def _extract_dcir_items(text: Optional[str]) -> Tuple[Tuple[str, Any], ...]:
+    """Cached body of extract_dcir_spec, as immutable (key, value) pairs."""
+    result: Dict[str, Any] = {
         'value_mohm': None,
         'temperature_c': None,
         'soc_percent': None,
@@ -242,56 +575,58 @@ def extract_dcir_spec(text: str) -> Dict[str, Any]:
     }
 
     if not text:
-        return result
+        return tuple(result.items())
 
     text = text.strip()
 
+    # Single scan: keep the first occurrence of each token kind
+    first: Dict[Optional[str], re.Match] = {}
+    for token in _RE_DCIR_TOKENS.finditer(text):
+        kind = token.lastgroup
+        if kind not in first:
+            first[kind] = token
+
     # Determine type (ACIR vs DCIR)
-    if re.search(r'(ac|1\s*k\s*hz|1000\s*hz)', text, re.IGNORECASE):
+    if 'ac' in first:
         result['type'] = 'acir'
         result['frequency_hz'] = 1000
-    elif re.search(r'(dc|dcir)', text, re.IGNORECASE):
+    elif 'dc' in first:
         result['type'] = 'dcir'
 
-    # Extract impedance value
-    value_patterns = [
-        r'[≤≥<>]?\s*([\d.]+)\s*m[Ωω]',  # mΩ format
-        r'[≤≥<>]?\s*([\d.]+)\s*mohm',   # mohm format
-        r'impedance[:\s]+[≤≥<>]?\s*([\d.]+)',  # Generic impedance
-    ]
-
-    for pattern in value_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            try:
-                result['value_mohm'] = float(match.group(1))
-                break
-            except ValueError:
-                continue
+    # Extract impedance value, falling back to lower-priority formats
+    for kind, group in _DCIR_VALUE_TOKENS:
+        match = first.get(kind)
+        if match is None:
+            continue
+        try:
+            result['value_mohm'] = float(match.group(group))
+            break
+        except ValueError:
+            continue
 
     # Extract temperature
-    temp_match = re.search(r'([-+]?\d+)\s*[°]?[Cc](?![Cc])', text)
-    if temp_match:
-        result['temperature_c'] = float(temp_match.group(1))
+    match = first.get('temp')
+    if match is not None:
+        result['temperature_c'] = float(match.group('temp_value'))
 
     # Extract SOC
-    soc_match = re.search(r'(\d+)\s*%\s*SOC', text, re.IGNORECASE)
-    if soc_match:
-        result['soc_percent'] = float(soc_match.group(1))
+    match = first.get('soc')
+    if match is not None:
+        result['soc_percent'] = float(match.group('soc_value'))
 
     # Extract pulse duration
-    pulse_match = re.search(r'(\d+)\s*s(?:ec)?\s*(?:pulse)?', text, re.IGNORECASE)
-    if pulse_match:
-        result['pulse_duration_s'] = float(pulse_match.group(1))
+    match = first.get('pulse')
+    if match is not None:
+        result['pulse_duration_s'] = float(match.group('pulse_value'))
 
-    return result
+    return tuple(result.items())
 
 
 # =============================================================================
 # CAPACITY AND CURRENT PARSING
 # =============================================================================
 
-def parse_capacity(text: str) -> Dict[str, Any]:
+def parse_capacity(text: Optional[str]) -> Dict[str, Any]:
     """
     Parse capacity specification.
 
@@ -307,7 +642,7 @@ def parse_capacity(text: str) -> Dict[str, Any]:
     Returns:
         Dictionary with 'nominal_ah', 'minimum_ah', 'unit_original'
     """
-    result = {
+    result: Dict[str, Any] = {
         'nominal_ah': None,
         'minimum_ah': None,
         'unit_original': None
@@ -317,47 +652,34 @@ def parse_capacity(text: str) -> Dict[str, Any]:
         return result
 
     # Check for typical/nominal value
-    typ_patterns = [
-        r'(?:typ\.?|typical|nom\.?|nominal)[:\s]*([\d.]+)\s*(m?ah)',
-        r'([\d.]+)\s*(m?ah)\s*\(?typ\.?\)?',
-        r'([\d.]+)\s*(m?ah)',  # Fallback
-    ]
-
-    for pattern in typ_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            value = float(match.group(1))
-            unit = match.group(2).lower()
-            result['unit_original'] = unit
-
-            if 'mah' in unit:
-                result['nominal_ah'] = value / 1000
-            else:
-                result['nominal_ah'] = value
-            break
+    match = _RE_CAP_TYP.match(text)
+    if match:
+        raw_value, raw_unit = _first_alternative(match, 2)
+        value = float(raw_value)
+        unit = raw_unit.lower()
+        result['unit_original'] = unit
 
-    # Check for minimum value
-    min_patterns = [
-        r'(?:min\.?|minimum)[:\s]*([\d.]+)\s*(m?ah)',
-        r'([\d.]+)\s*(m?ah)\s*\(?min\.?\)?',
-    ]
+        if 'mah' in unit:
+            result['nominal_ah'] = value / 1000
+        else:
+            result['nominal_ah'] = value
 
-    for pattern in min_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            value = float(match.group(1))
-            unit = match.group(2).lower()
+    # Check for minimum value
+    match = _RE_CAP_MIN.match(text)
+    if match:
+        raw_value, raw_unit = _first_alternative(match, 2)
+        value = float(raw_value)
+        unit = raw_unit.lower()
 
-            if 'mah' in unit:
-                result['minimum_ah'] = value / 1000
-            else:
-                result['minimum_ah'] = value
-            break
+        if 'mah' in unit:
+            result['minimum_ah'] = value / 1000
+        else:
+            result['minimum_ah'] = value
 
     return result
 
 
-def parse_current_rating(text: str, capacity_ah: Optional[float] = None
+def parse_current_rating(text: Optional[str], capacity_ah: Optional[float] = None
                          ) -> Dict[str, Any]:
     """
     Parse current rating from various formats.
@@ -375,7 +697,7 @@ def parse_current_rating(text: str, capacity_ah: Optional[float] = None
     Returns:
         Dictionary with current value and conditions
     """
-    result = {
+    result: Dict[str, Any] = {
         'value_a': None,
         'is_c_rate': False,
         'c_rate': None,
@@ -387,7 +709,7 @@ def parse_current_rating(text: str, capacity_ah: Optional[float] = None
         return result
 
     # Check for C-rate
-    c_rate_match = re.search(r'([\d.]+)\s*C\b', text)
+    c_rate_match = _RE_CURRENT_C_RATE.search(text)
     if c_rate_match:
         c_rate = float(c_rate_match.group(1))
         result['c_rate'] = c_rate
@@ -397,18 +719,18 @@ def parse_current_rating(text: str, capacity_ah: Optional[float] = None
             result['value_a'] = c_rate * capacity_ah
 
     # Check for direct Amperage
-    amp_match = re.search(r'([\d.]+)\s*A\b(?!\s*h)', text)
+    amp_match = _RE_CURRENT_AMP.search(text)
     if amp_match and result['value_a'] is None:
         result['value_a'] = float(amp_match.group(1))
 
     # Check for pulse duration
-    duration_match = re.search(r'(?:for\s+)?(\d+)\s*s(?:ec)?', text)
+    duration_match = _RE_CURRENT_DURATION.search(text)
     if duration_match:
         result['duration_s'] = float(duration_match.group(1))
         result['is_pulse'] = True
 
     # Check for pulse keywords
-    if re.search(r'pulse|peak|burst', text, re.IGNORECASE):
+    if _RE_CURRENT_PULSE.search(text):
         result['is_pulse'] = True
 
     return result
@@ -418,7 +740,18 @@ def parse_current_rating(text: str, capacity_ah: Optional[float] = None
 # DIMENSIONS PARSING
 # =============================================================================
 
-def parse_dimensions(text: str, cell_format: str = None) -> Dict[str, Any]:
+def _sort3_desc(a: float, b: float, c: float) -> Tuple[float, float, float]:
+    """Sort three values in descending order with a 3-comparator network."""
+    if a < b:
+        a, b = b, a
+    if b < c:
+        b, c = c, b
+    if a < b:
+        a, b = b, a
+    return a, b, c
+
+
+def parse_dimensions(text: Optional[str], cell_format: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse cell dimensions from various formats.
 
@@ -434,59 +767,47 @@ def parse_dimensions(text: str, cell_format: str = None) -> Dict[str, Any]:
     Returns:
         Dictionary with parsed dimensions
     """
-    result = {}
+    result: Dict[str, Any] = {}
 
     if not text:
         return result
 
     # Cylindrical format: Ø21 x 70
-    cyl_patterns = [
-        r'[Øø∅]?\s*([\d.]+)\s*[x×]\s*([\d.]+)\s*(?:mm)?',
-        r'([\d.]+)\s*mm?\s*[x×]\s*([\d.]+)\s*mm?',
-    ]
-
-    if cell_format == 'cylindrical' or re.search(r'[Øø∅]', text):
-        for pattern in cyl_patterns:
-            match = re.search(pattern, text)
-            if match:
-                dim1 = float(match.group(1))
-                dim2 = float(match.group(2))
-
-                # Smaller value is diameter, larger is height
-                if dim1 < dim2:
-                    result['diameter_mm'] = dim1
-                    result['height_mm'] = dim2
-                else:
-                    result['diameter_mm'] = dim2
-                    result['height_mm'] = dim1
-                break
+    if cell_format == 'cylindrical' or _RE_DIAMETER_MARK.search(text):
+        match = _RE_DIM_CYL.match(text)
+        if match:
+            dim1, dim2 = _first_alternative(match, 2)
+            dim1 = float(dim1)
+            dim2 = float(dim2)
+
+            # Smaller value is diameter, larger is height
+            result['diameter_mm'], result['height_mm'] = (
+                (dim1, dim2) if dim1 < dim2 else (dim2, dim1)
+            )
 
     # Three-dimension format: L x W x T/H
-    three_dim_match = re.search(
-        r'([\d.]+)\s*[x×*]\s*([\d.]+)\s*[x×*]\s*([\d.]+)\s*(?:mm)?',
-        text
-    )
+    three_dim_match = _RE_DIM_3D.search(text)
 
     if three_dim_match:
-        dims = sorted([
+        longest, middle, shortest = _sort3_desc(
             float(three_dim_match.group(1)),
             float(three_dim_match.group(2)),
             float(three_dim_match.group(3))
-        ], reverse=True)
+        )
 
         if cell_format == 'pouch':
-            result['length_mm'] = dims[0]
-            result['width_mm'] = dims[1]
-            result['thickness_mm'] = dims[2]
+            result['length_mm'] = longest
+            result['width_mm'] = middle
+            result['thickness_mm'] = shortest
         elif cell_format == 'prismatic':
-            result['length_mm'] = dims[0]
-            result['width_mm'] = dims[1]
-            result['height_mm'] = dims[2]
+            result['length_mm'] = longest
+            result['width_mm'] = middle
+            result['height_mm'] = shortest
         else:
             # Default to longest=length, middle=width, shortest=thickness/height
-            result['length_mm'] = dims[0]
-            result['width_mm'] = dims[1]
-            result['thickness_mm'] = dims[2]
+            result['length_mm'] = longest
+            result['width_mm'] = middle
+            result['thickness_mm'] = shortest
 
     return result
 
@@ -495,7 +816,7 @@ def parse_dimensions(text: str, cell_format: str = None) -> Dict[str, Any]:
 # CYCLE LIFE PARSING
 # =============================================================================
 
-def parse_cycle_life(text: str) -> Dict[str, Any]:
+def parse_cycle_life(text: Optional[str]) -> Dict[str, Any]:
     """
     Parse cycle life specification with conditions.
 
@@ -511,7 +832,7 @@ def parse_cycle_life(text: str) -> Dict[str, Any]:
     Returns:
         Dictionary with cycle life and test conditions
     """
-    result = {
+    result: Dict[str, Any] = {
         'cycles': None,
         'end_of_life_soh_percent': 80.0,  # Default to 80%
         'dod_percent': None,
@@ -524,51 +845,49 @@ def parse_cycle_life(text: str) -> Dict[str, Any]:
     if not text:
         return result
 
-    # Extract cycle count
-    cycle_patterns = [
-        r'[≥>]?\s*([\d,]+)\s*(?:cycles?|times)',
-        r'(?:cycles?|times)[:\s]+([\d,]+)',
-    ]
+    # Tokenize once, keeping the first token of each kind
+    tokens: Dict[Optional[str], re.Match] = {}
+    for token in _RE_CYCLE_TOKENS.finditer(text):
+        tokens.setdefault(token.lastgroup, token)
 
-    for pattern in cycle_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            result['cycles'] = int(match.group(1).replace(',', ''))
-            break
+    # Extract cycle count
+    match = tokens.get('cycles')
+    if match:
+        result['cycles'] = int(match.group('cycles_value').replace(',', ''))
+    elif 'cycles_after' in tokens:
+        result['cycles'] = int(
+            tokens['cycles_after'].group('cycles_after_value').replace(',', '')
+        )
 
     # Extract DOD
-    dod_match = re.search(r'(\d+)\s*%\s*DOD', text, re.IGNORECASE)
-    if dod_match:
-        result['dod_percent'] = float(dod_match.group(1))
+    if 'dod' in tokens:
+        result['dod_percent'] = float(tokens['dod'].group('dod_value'))
 
     # Extract EOL SOH
-    eol_patterns = [
-        r'(?:to|at)\s+(\d+)\s*%\s*(?:capacity|SOH)',
-        r'(\d+)\s*%\s*(?:remaining|retention)',
-    ]
-    for pattern in eol_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            result['end_of_life_soh_percent'] = float(match.group(1))
-            break
+    if 'eol' in tokens:
+        result['end_of_life_soh_percent'] = float(tokens['eol'].group('eol_value'))
+    elif 'retention' in tokens:
+        result['end_of_life_soh_percent'] = float(
+            tokens['retention'].group('retention_value')
+        )
 
     # Extract C-rates (charge/discharge)
-    c_rate_match = re.search(r'([\d.]+)\s*C\s*/\s*([\d.]+)\s*C', text)
-    if c_rate_match:
-        result['charge_rate_c'] = float(c_rate_match.group(1))
-        result['discharge_rate_c'] = float(c_rate_match.group(2))
+    match = _RE_CYCLE_C_RATES.search(text)
+    if match:
+        result['charge_rate_c'] = float(match.group(1))
+        result['discharge_rate_c'] = float(match.group(2))
     else:
         # Single C-rate for both
-        single_c = re.search(r'@?\s*([\d.]+)\s*C(?!\s*/)', text)
-        if single_c:
-            rate = float(single_c.group(1))
+        match = _RE_CYCLE_SINGLE_C.search(text)
+        if match:
+            rate = float(match.group(1))
             result['charge_rate_c'] = rate
             result['discharge_rate_c'] = rate
 
     # Extract temperature
-    temp_match = re.search(r'([-+]?\d+)\s*°?C', text)
-    if temp_match:
-        result['temperature_c'] = float(temp_match.group(1))
+    match = _RE_CYCLE_TEMP.search(text)
+    if match:
+        result['temperature_c'] = float(match.group(1))
 
     # Store original text as notes
     result['notes'] = text.strip()
@@ -580,7 +899,35 @@ def parse_cycle_life(text: str) -> Dict[str, Any]:
 # DERIVED PROPERTY CALCULATIONS
 # =============================================================================
 
-def calculate_energy(voltage_nominal: float, capacity_ah: float) -> Dict[str, Any]:
+def _round1(x: float) -> float:
+    """Round half away from zero to 1 decimal (display precision)."""
+    try:
+        if x < 0.0:
+            return -int(-x * 10.0 + 0.5) / 10.0
+        return int(x * 10.0 + 0.5) / 10.0
+    except (OverflowError, ValueError):  # inf / nan pass through
+        return x
+
+
+def _round2(x: float) -> float:
+    """Round half away from zero to 2 decimals (display precision)."""
+    try:
+        if x < 0.0:
+            return -int(-x * 100.0 + 0.5) / 100.0
+        return int(x * 100.0 + 0.5) / 100.0
+    except (OverflowError, ValueError):  # inf / nan pass through
+        return x
+
+
+def _round_array(values: Any, digits: int) -> Any:
+    """Round a numpy array half away from zero, matching _round1/_round2."""
+    import numpy as np
+    scale = 10.0 ** digits
+    return np.sign(values) * np.floor(np.abs(values) * scale + 0.5) / scale
+
+
+def calculate_energy(voltage_nominal: Optional[_Number],
+                     capacity_ah: Optional[_Number]) -> Dict[str, Any]:
     """
     Calculate energy in Wh.
 
@@ -596,14 +943,15 @@ def calculate_energy(voltage_nominal: float, capacity_ah: float) -> Dict[str, An
 
     energy = voltage_nominal * capacity_ah
     return {
-        'value': round(energy, 2),
+        'value': _round2(energy),
         'source': 'calculated',
         'calculation': f"{voltage_nominal}V × {capacity_ah}Ah"
     }
 
 
-def calculate_max_power(voltage: float, current_continuous: float = None,
-                        current_pulse: float = None) -> Dict[str, Any]:
+def calculate_max_power(voltage: Optional[_Number],
+                        current_continuous: Optional[_Number] = None,
+                        current_pulse: Optional[_Number] = None) -> Dict[str, Any]:
     """
     Calculate maximum power with fallback logic.
 
@@ -624,7 +972,7 @@ def calculate_max_power(voltage: float, current_continuous: float = None,
     if current_pulse is not None:
         power = voltage * current_pulse
         return {
-            'value': round(power, 1),
+            'value': _round1(power),
             'source': 'calculated_from_pulse',
             'calculation': f"{voltage}V × {current_pulse}A (pulse)",
             'pulse_data_available': True
@@ -634,7 +982,7 @@ def calculate_max_power(voltage: float, current_continuous: float = None,
     if current_continuous is not None:
         power = voltage * current_continuous
         return {
-            'value': round(power, 1),
+            'value': _round1(power),
             'source': 'calculated_from_continuous',
             'calculation': f"{voltage}V × {current_continuous}A (continuous)",
             'pulse_data_available': False
@@ -643,7 +991,33 @@ def calculate_max_power(voltage: float, current_continuous: float = None,
     return {'value': None, 'source': 'missing', 'pulse_data_available': False}
 
 
-def calculate_volume(cell_format: str, dimensions: Dict) -> Dict[str, Any]:
+# (d_mm/2/10)² × π × (h_mm/10) = d² × h × π / 4000
+_CYL_K = math.pi / 4000.0
+
+
+def _cylinder_volume_ml(diameter_mm, height_mm):
+    """Cylinder volume in mL from mm dimensions (scalars or numpy arrays)."""
+    # Volume = π × (d/2)² × h with mm³ -> mL folded into _CYL_K
+    return _CYL_K * diameter_mm * diameter_mm * height_mm
+
+
+def _box_volume_ml(length_mm, width_mm, depth_mm):
+    """Box volume in mL from mm dimensions (scalars or numpy arrays)."""
+    return (length_mm * width_mm * depth_mm) / 1000  # mm³ to cm³
+
+
+# Format -> (dimension keys, volume kernel, calculation description)
+_VOLUME_FORMULAS: Dict[str, Tuple[Tuple[str, ...], Callable[..., Any], str]] = {
+    'cylindrical': (('diameter_mm', 'height_mm'),
+                    _cylinder_volume_ml, 'π × (d/2)² × h'),
+    'pouch': (('length_mm', 'width_mm', 'thickness_mm'),
+              _box_volume_ml, 'L × W × T / 1000'),
+    'prismatic': (('length_mm', 'width_mm', 'height_mm'),
+                  _box_volume_ml, 'L × W × H / 1000'),
+}
+
+
+def calculate_volume(cell_format: Optional[str], dimensions: Optional[Dict]) -> Dict[str, Any]:
     """
     Calculate cell volume based on format.
 
@@ -664,13 +1038,10 @@ def calculate_volume(cell_format: str, dimensions: Dict) -> Dict[str, Any]:
         if diameter is None or height is None:
             return {'value': None, 'source': 'missing', 'calculation': None}
 
-        # Volume = π × r² × h, convert mm³ to mL (cm³)
-        radius_cm = diameter / 20  # mm to cm, then /2 for radius
-        height_cm = height / 10    # mm to cm
-        volume = math.pi * (radius_cm ** 2) * height_cm
+        volume = _cylinder_volume_ml(diameter, height)
 
         return {
-            'value': round(volume, 2),
+            'value': _round2(volume),
             'source': 'calculated',
             'calculation': 'π × (d/2)² × h'
         }
@@ -680,13 +1051,13 @@ def calculate_volume(cell_format: str, dimensions: Dict) -> Dict[str, Any]:
         width = dimensions.get('width_mm')
         thickness = dimensions.get('thickness_mm')
 
-        if any(v is None for v in [length, width, thickness]):
+        if length is None or width is None or thickness is None:
             return {'value': None, 'source': 'missing', 'calculation': None}
 
-        volume = (length * width * thickness) / 1000  # mm³ to cm³
+        volume = _box_volume_ml(length, width, thickness)
 
         return {
-            'value': round(volume, 2),
+            'value': _round2(volume),
             'source': 'calculated',
             'calculation': 'L × W × T / 1000'
         }
@@ -696,13 +1067,13 @@ def calculate_volume(cell_format: str, dimensions: Dict) -> Dict[str, Any]:
         width = dimensions.get('width_mm')
         height = dimensions.get('height_mm')
 
-        if any(v is None for v in [length, width, height]):
+        if length is None or width is None or height is None:
             return {'value': None, 'source': 'missing', 'calculation': None}
 
-        volume = (length * width * height) / 1000  # mm³ to cm³
+        volume = _box_volume_ml(length, width, height)
 
         return {
-            'value': round(volume, 2),
+            'value': _round2(volume),
             'source': 'calculated',
             'calculation': 'L × W × H / 1000'
         }
@@ -710,8 +1081,54 @@ def calculate_volume(cell_format: str, dimensions: Dict) -> Dict[str, Any]:
     return {'value': None, 'source': 'unknown_format', 'calculation': None}
 
 
-def calculate_densities(energy_wh: float, max_power_w: float,
-                        weight_g: float, volume_ml: float,
+def calculate_volume_batch(cell_format: str,
+                           dimensions: Dict[str, Sequence[float]]
+                           ) -> Dict[str, Any]:
+    """
+    Calculate volumes for many cells of the same format at once.
+
+    Vectorized counterpart of calculate_volume: each dimension key maps to
+    a sequence with one entry per cell, and the volume kernel is evaluated
+    over whole numpy arrays instead of once per cell.
+
+    Requires numpy (pip install numpy).
+
+    Args:
+        cell_format: One of 'cylindrical', 'pouch', 'prismatic'
+        dimensions: Dictionary mapping dimension names to per-cell sequences
+
+    Returns:
+        Dictionary with a numpy array of volumes in mL, source, and
+        calculation method
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "numpy is required for batch volume calculation. "
+            "Install with: pip install numpy"
+        )
+
+    if cell_format not in _VOLUME_FORMULAS:
+        return {'value': None, 'source': 'unknown_format', 'calculation': None}
+
+    keys, kernel, calculation = _VOLUME_FORMULAS[cell_format]
+    if not dimensions or any(dimensions.get(k) is None for k in keys):
+        return {'value': None, 'source': 'missing', 'calculation': None}
+
+    arrays = [np.asarray(dimensions[k], dtype=np.float64) for k in keys]
+    return {
+        'value': _round_array(kernel(*arrays), 2),
+        'source': 'calculated',
+        'calculation': calculation
+    }
+
+
+def calculate_densities(energy_wh: Optional[float], max_power_w: Optional[float],
+                        weight_g: Optional[float], volume_ml: Optional[float],
                         pulse_data_available: bool = False) -> Dict[str, Any]:
     """
     Calculate gravimetric and volumetric densities.
@@ -726,7 +1143,7 @@ def calculate_densities(energy_wh: float, max_power_w: float,
     Returns:
         Dictionary with all density values
     """
-    result = {
+    result: Dict[str, Any] = {
         'energy_density_gravimetric_wh_per_kg': None,
         'power_density_gravimetric_w_per_kg': None,
         'energy_density_volumetric_wh_per_l': None,
@@ -739,32 +1156,91 @@ def calculate_densities(energy_wh: float, max_power_w: float,
 
     if energy_wh is not None:
         if weight_kg:
-            result['energy_density_gravimetric_wh_per_kg'] = round(
-                energy_wh / weight_kg, 1
+            result['energy_density_gravimetric_wh_per_kg'] = _round1(
+                energy_wh / weight_kg
             )
         if volume_l:
-            result['energy_density_volumetric_wh_per_l'] = round(
-                energy_wh / volume_l, 1
+            result['energy_density_volumetric_wh_per_l'] = _round1(
+                energy_wh / volume_l
             )
 
     if max_power_w is not None:
         if weight_kg:
-            result['power_density_gravimetric_w_per_kg'] = round(
-                max_power_w / weight_kg, 1
+            result['power_density_gravimetric_w_per_kg'] = _round1(
+                max_power_w / weight_kg
             )
         if volume_l:
-            result['power_density_volumetric_w_per_l'] = round(
-                max_power_w / volume_l, 1
+            result['power_density_volumetric_w_per_l'] = _round1(
+                max_power_w / volume_l
             )
 
     return result
 
 
+def calculate_densities_batch(energy_wh: Sequence[Optional[float]],
+                              max_power_w: Sequence[Optional[float]],
+                              weight_g: Sequence[Optional[float]],
+                              volume_ml: Sequence[Optional[float]]
+                              ) -> Dict[str, Any]:
+    """
+    Calculate gravimetric and volumetric densities for many cells at once.
+
+    Vectorized counterpart of calculate_densities for datasheet libraries.
+    Inputs are parallel sequences (one entry per cell); None entries and
+    zero weights/volumes produce NaN in the output arrays.
+
+    Requires numpy (pip install numpy).
+
+    Args:
+        energy_wh: Total energy per cell in Wh
+        max_power_w: Maximum power per cell in W
+        weight_g: Cell weights in grams
+        volume_ml: Cell volumes in mL (cm³)
+
+    Returns:
+        Dictionary with one numpy array per density value
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "numpy is required for batch density calculation. "
+            "Install with: pip install numpy"
+        )
+
+    energy = np.asarray(energy_wh, dtype=np.float64)
+    power = np.asarray(max_power_w, dtype=np.float64)
+    weight_kg = np.asarray(weight_g, dtype=np.float64) / 1000.0
+    volume_l = np.asarray(volume_ml, dtype=np.float64) / 1000.0
+
+    has_weight = weight_kg != 0
+    has_volume = volume_l != 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            'energy_density_gravimetric_wh_per_kg': _round_array(
+                np.where(has_weight, energy / weight_kg, np.nan), 1
+            ),
+            'power_density_gravimetric_w_per_kg': _round_array(
+                np.where(has_weight, power / weight_kg, np.nan), 1
+            ),
+            'energy_density_volumetric_wh_per_l': _round_array(
+                np.where(has_volume, energy / volume_l, np.nan), 1
+            ),
+            'power_density_volumetric_w_per_l': _round_array(
+                np.where(has_volume, power / volume_l, np.nan), 1
+            ),
+        }
+
+
 # =============================================================================
 # TABLE LAYOUT DETECTION
 # =============================================================================
 
-def detect_table_layout(table_text: str, num_columns: int = None
+def detect_table_layout(table_text: Optional[str], num_columns: Optional[int] = None
                        ) -> Dict[str, Any]:
     """
     Detect the layout pattern of a specification table.
@@ -774,67 +1250,94 @@ def detect_table_layout(table_text: str, num_columns: int = None
         num_columns: Number of columns if known
 
     Returns:
-        Dictionary with detected pattern and confidence
+        Dictionary with detected pattern, confidence, and a tuple of
+        indicator descriptions
     """
-    result = {
-        'pattern': 'unknown',
-        'confidence': 'low',
-        'indicators': []
-    }
-
     if not table_text:
-        return result
-
-    text_lower = table_text.lower()
+        return {'pattern': 'unknown', 'confidence': 'low', 'indicators': ()}
+
+    # Tag indicators in a single scan, stopping early once the
+    # highest-priority pattern that can still apply has been seen
+    need_comparison = bool(num_columns and num_columns > 3)
+    top_indicator = 'comparison' if need_comparison else 'multi_condition'
+    found = set()
+    for match in _RE_LAYOUT.finditer(table_text):
+        found.add(match.lastgroup)
+        if match.lastgroup == top_indicator:
+            break
 
     # Check for Pattern D: Multi-product comparison
     # Look for multiple model numbers in header row
-    if (re.search(r'(e\d+[a-z]+|model\s*[a-z]|type\s*[a-z])', text_lower,
-                  re.IGNORECASE)
-        and num_columns and num_columns > 3):
-        result['pattern'] = 'comparison_table'
-        result['confidence'] = 'medium'
-        result['indicators'].append('Multiple product columns detected')
-        return result
+    if need_comparison and 'comparison' in found:
+        return {'pattern': 'comparison_table', 'confidence': 'medium',
+                'indicators': ('Multiple product columns detected',)}
 
     # Check for Pattern B: Multi-condition tables
-    if re.search(r'(item|條項).*?(condition|條件).*?(specification|規格)',
-                 text_lower, re.IGNORECASE):
-        result['pattern'] = 'multi_condition'
-        result['confidence'] = 'high'
-        result['indicators'].append('Item/Condition/Specification headers found')
-        return result
+    if 'multi_condition' in found:
+        return {'pattern': 'multi_condition', 'confidence': 'high',
+                'indicators': ('Item/Condition/Specification headers found',)}
 
     # Check for numbered items (common in Samsung/LG)
-    if re.search(r'\b[12]\.[0-9]\s+\w+', text_lower):
-        result['pattern'] = 'multi_condition'
-        result['confidence'] = 'medium'
-        result['indicators'].append('Numbered item format (e.g., 2.1, 2.2)')
-        return result
+    if 'numbered' in found:
+        return {'pattern': 'multi_condition', 'confidence': 'medium',
+                'indicators': ('Numbered item format (e.g., 2.1, 2.2)',)}
 
     # Check for Pattern A: Key-value (2-column)
     if num_columns == 2:
-        result['pattern'] = 'key_value'
-        result['confidence'] = 'high'
-        result['indicators'].append('Two-column table detected')
-        return result
+        return {'pattern': 'key_value', 'confidence': 'high',
+                'indicators': ('Two-column table detected',)}
 
     # Check for Pattern C: Visual grouping (indentation-based)
-    if re.search(r'^\s{2,}', table_text, re.MULTILINE):
-        result['pattern'] = 'visual_grouping'
-        result['confidence'] = 'medium'
-        result['indicators'].append('Indentation-based hierarchy detected')
-        return result
+    if 'indent' in found:
+        return {'pattern': 'visual_grouping', 'confidence': 'medium',
+                'indicators': ('Indentation-based hierarchy detected',)}
 
-    return result
+    return {'pattern': 'unknown', 'confidence': 'low', 'indicators': ()}
 
 
 # =============================================================================
 # CONFIDENCE SCORING
 # =============================================================================
 
+# Field paths pre-split into key tuples so scoring never re-splits strings
+_REQUIRED_FIELDS_DEFAULT: Tuple[Tuple[str, ...], ...] = (
+    ('cell_info', 'manufacturer'),
+    ('cell_info', 'model_number'),
+    ('electrical', 'capacity', 'nominal_ah'),
+    ('electrical', 'voltage', 'nominal_v'),
+)
+_SECTION_FIELDS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    'mechanical': (('weight_g',), ('volume_ml',)),
+    'electrical': (('capacity', 'nominal_ah'), ('voltage', 'nominal_v'),
+                   ('impedance', 'acir', 'value_mohm')),
+    'temperature': (('operating', 'charge', 'min_c'),
+                    ('operating', 'discharge', 'min_c')),
+    'lifetime': (('cycle_life', 'cycles'),),
+}
+
+
+def _get_nested(data: Any, keys: Tuple[str, ...]) -> Any:
+    """
+    Safely get a nested value by walking a tuple of keys.
+
+    Args:
+        data: Dictionary to walk
+        keys: Pre-split key path (e.g., ('capacity', 'nominal_ah'))
+
+    Returns:
+        The value at the path, or None if any level is missing
+    """
+    value = data
+    for key in keys:
+        if isinstance(value, dict):
+            value = value.get(key)
+        else:
+            return None
+    return value
+
+
 def calculate_confidence(extracted_data: Dict[str, Any],
-                        required_fields: List[str] = None) -> Dict[str, str]:
+                        required_fields: Optional[List[str]] = None) -> Dict[str, str]:
     """
     Calculate confidence scores for each section of extracted data.
 
@@ -845,13 +1348,11 @@ def calculate_confidence(extracted_data: Dict[str, Any],
     Returns:
         Dictionary with confidence scores per section
     """
+    required_keys: Sequence[Tuple[str, ...]]
     if required_fields is None:
-        required_fields = [
-            'cell_info.manufacturer',
-            'cell_info.model_number',
-            'electrical.capacity.nominal_ah',
-            'electrical.voltage.nominal_v',
-        ]
+        required_keys = _REQUIRED_FIELDS_DEFAULT
+    else:
+        required_keys = [tuple(field.split('.')) for field in required_fields]
 
     scores = {
         'mechanical': 'medium',
@@ -861,21 +1362,10 @@ def calculate_confidence(extracted_data: Dict[str, Any],
         'overall': 'medium'
     }
 
-    # Helper to safely get nested values
-    def get_nested(data: dict, path: str):
-        keys = path.split('.')
-        value = data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
-        return value
-
     # Check required fields
     missing_required = 0
-    for field in required_fields:
-        if get_nested(extracted_data, field) is None:
+    for keys in required_keys:
+        if _get_nested(extracted_data, keys) is None:
             missing_required += 1
 
     if missing_required == 0:
@@ -886,19 +1376,11 @@ def calculate_confidence(extracted_data: Dict[str, Any],
         scores['overall'] = 'low'
 
     # Score each section based on completeness
-    sections = {
-        'mechanical': ['weight_g', 'volume_ml'],
-        'electrical': ['capacity.nominal_ah', 'voltage.nominal_v',
-                      'impedance.acir.value_mohm'],
-        'temperature': ['operating.charge.min_c', 'operating.discharge.min_c'],
-        'lifetime': ['cycle_life.cycles']
-    }
-
-    for section, fields in sections.items():
+    for section, fields in _SECTION_FIELDS.items():
         section_data = extracted_data.get(section, {})
         found = 0
-        for field in fields:
-            if get_nested(section_data, field) is not None:
+        for keys in fields:
+            if _get_nested(section_data, keys) is not None:
                 found += 1
 
         if found == len(fields):
@@ -915,7 +1397,22 @@ def calculate_confidence(extracted_data: Dict[str, Any],
 # VALIDATION UTILITIES
 # =============================================================================
 
-def validate_value_range(value: float, field_name: str) -> Tuple[bool, str]:
+# Expected (min, max) per field, shared by the scalar and batch validators
+_RANGES: Dict[str, Tuple[_Number, _Number]] = {
+    'capacity_ah': (0.01, 500),       # Ah
+    'voltage_nominal': (2.5, 4.5),    # V
+    'voltage_max': (3.0, 5.0),        # V
+    'voltage_min': (1.0, 3.5),        # V
+    'impedance_mohm': (0.1, 500),     # mΩ
+    'weight_g': (1, 10000),           # g
+    'temperature_c': (-60, 100),      # °C
+    'current_a': (0.01, 1000),        # A
+    'cycles': (1, 100000),            # cycles
+}
+
+
+def validate_value_range(value: Optional[_Number], field_name: str
+                         ) -> Tuple[bool, Optional[str]]:
     """
     Validate that a value falls within expected ranges.
 
@@ -924,28 +1421,13 @@ def validate_value_range(value: float, field_name: str) -> Tuple[bool, str]:
         field_name: Name of the field for lookup
 
     Returns:
-        Tuple of (is_valid, warning_message)
+        Tuple of (is_valid, warning_message); the message is None when valid
     """
-    ranges = {
-        'capacity_ah': (0.01, 500),       # Ah
-        'voltage_nominal': (2.5, 4.5),    # V
-        'voltage_max': (3.0, 5.0),        # V
-        'voltage_min': (1.0, 3.5),        # V
-        'impedance_mohm': (0.1, 500),     # mΩ
-        'weight_g': (1, 10000),           # g
-        'temperature_c': (-60, 100),      # °C
-        'current_a': (0.01, 1000),        # A
-        'cycles': (1, 100000),            # cycles
-    }
-
-    if field_name not in ranges:
-        return (True, '')
-
-    min_val, max_val = ranges[field_name]
-
-    if value is None:
-        return (True, '')
+    bounds = _RANGES.get(field_name)
+    if bounds is None or value is None:
+        return (True, None)
 
+    min_val, max_val = bounds
     if value < min_val or value > max_val:
         return (
             False,
@@ -953,14 +1435,37 @@ def validate_value_range(value: float, field_name: str) -> Tuple[bool, str]:
             f"[{min_val}, {max_val}]"
         )
 
-    return (True, '')
+    return (True, None)
+
+
+def is_valid(value: Optional[float], field_name: str) -> bool:
+    """
+    Check a value against the expected range without building a message.
+
+    Fast path of validate_value_range for callers that only need the flag.
+
+    Args:
+        value: The value to validate
+        field_name: Name of the field for lookup
+
+    Returns:
+        True if the value is within range, missing, or the field is unknown
+    """
+    bounds = _RANGES.get(field_name)
+    if bounds is None or value is None:
+        return True
+    return not (value < bounds[0] or value > bounds[1])
 
 
 # =============================================================================
 # MAIN EXTRACTION ORCHESTRATOR
 # =============================================================================
 
-def extract_cell_specs(raw_data: Dict[str, str]) -> Dict[str, Any]:
+# Nominal voltage assumed for energy when the datasheet gives none (V)
+DEFAULT_NOMINAL_V = 3.6
+
+
+def extract_cell_specs(raw_data: Dict[str, Optional[str]]) -> Dict[str, Any]:
     """
     Main orchestrator function to extract and normalize cell specifications.
 
@@ -973,32 +1478,36 @@ def extract_cell_specs(raw_data: Dict[str, str]) -> Dict[str, Any]:
     Returns:
         Standardized cell specification dictionary
     """
-    result = {
+    # Bind the sections we fill in to locals instead of re-indexing result
+    electrical: Dict[str, Any] = {}
+    derived: Dict[str, Any] = {}
+    missing: List[str] = []
+    warnings: List[str] = []
+    result: Dict[str, Any] = {
         'cell_info': {},
         'mechanical': {},
-        'electrical': {},
+        'electrical': electrical,
         'temperature': {},
         'lifetime': {},
-        'derived': {},
+        'derived': derived,
         'extraction_metadata': {
             'fields_extracted': 0,
             'fields_calculated': 0,
-            'fields_missing': [],
-            'warnings': []
+            'fields_missing': missing,
+            'warnings': warnings
         }
     }
 
     # Track extraction success
     extracted = 0
     calculated = 0
-    missing = []
-    warnings = []
 
     # --- Extract Capacity ---
+    capacity = None
     if 'capacity' in raw_data:
-        cap = parse_capacity(raw_data['capacity'])
-        result['electrical']['capacity'] = cap
-        if cap['nominal_ah']:
+        capacity = parse_capacity(raw_data['capacity'])
+        electrical['capacity'] = capacity
+        if capacity['nominal_ah']:
             extracted += 1
         else:
             missing.append('capacity.nominal_ah')
@@ -1009,20 +1518,20 @@ def extract_cell_specs(raw_data: Dict[str, str]) -> Dict[str, Any]:
     # (Would need more parsing logic here)
 
     # --- Calculate derived properties ---
-    if result['electrical'].get('capacity', {}).get('nominal_ah'):
-        nominal_v = result['electrical'].get('voltage', {}).get('nominal_v', 3.6)
-        cap_ah = result['electrical']['capacity']['nominal_ah']
+    if capacity and capacity['nominal_ah']:
+        voltage = electrical.get('voltage')
+        nominal_v = (voltage.get('nominal_v', DEFAULT_NOMINAL_V) if voltage
+                     else DEFAULT_NOMINAL_V)
 
-        energy = calculate_energy(nominal_v, cap_ah)
+        energy = calculate_energy(nominal_v, capacity['nominal_ah'])
         if energy['value']:
-            result['derived']['energy_wh'] = energy
+            derived['energy_wh'] = energy
             calculated += 1
 
     # Update metadata
-    result['extraction_metadata']['fields_extracted'] = extracted
-    result['extraction_metadata']['fields_calculated'] = calculated
-    result['extraction_metadata']['fields_missing'] = missing
-    result['extraction_metadata']['warnings'] = warnings
+    metadata = result['extraction_metadata']
+    metadata['fields_extracted'] = extracted
+    metadata['fields_calculated'] = calculated
 
     return result
 
@@ -1034,6 +1543,7 @@ def extract_cell_specs(raw_data: Dict[str, str]) -> Dict[str, Any]:
 __all__ = [
     # Unit conversion
     'normalize_units',
+    'normalize_units_bulk',
 
     # Parsing functions
     'parse_temperature_range',
@@ -1047,7 +1557,9 @@ __all__ = [
     'calculate_energy',
     'calculate_max_power',
     'calculate_volume',
+    'calculate_volume_batch',
     'calculate_densities',
+    'calculate_densities_batch',
 
     # Table detection
     'detect_table_layout',
@@ -1055,6 +1567,7 @@ __all__ = [
     # Validation
     'calculate_confidence',
     'validate_value_range',
+    'is_valid',
 
     # Main orchestrator
     'extract_cell_specs',
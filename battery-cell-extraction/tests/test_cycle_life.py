@@ -0,0 +1,34 @@
+"""
+parse_cycle_life: a bare "NN C" is both a C-rate and a temperature.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import extractor  # noqa: E402
+
+
+class CycleLifeTemperatureTest(unittest.TestCase):
+
+    def test_bare_c_is_read_as_temperature_too(self):
+        result = extractor.parse_cycle_life("1000 cycles at 25C")
+        self.assertEqual(result['cycles'], 1000)
+        self.assertEqual(result['temperature_c'], 25.0)
+        self.assertEqual(result['charge_rate_c'], 25.0)
+
+    def test_temperature_alongside_dod(self):
+        result = extractor.parse_cycle_life("2000 cycles @ 45C 80% DOD")
+        self.assertEqual(result['temperature_c'], 45.0)
+        self.assertEqual(result['dod_percent'], 80.0)
+
+    def test_degree_sign_temperature_after_c_rates(self):
+        result = extractor.parse_cycle_life("800 cycles 1C/2C, 45°C")
+        self.assertEqual(result['charge_rate_c'], 1.0)
+        self.assertEqual(result['discharge_rate_c'], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
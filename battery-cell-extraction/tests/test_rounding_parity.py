@@ -0,0 +1,70 @@
+"""
+Scalar vs batch parity for derived property rounding.
+
+calculate_volume_batch and calculate_densities_batch are vectorized
+counterparts of calculate_volume and calculate_densities, so both must
+round half away from zero to the same values.
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import extractor  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is required for the batch helpers")
+class RoundingParityTest(unittest.TestCase):
+
+    def assert_same(self, scalar, batch):
+        if scalar is None:
+            self.assertTrue(np.isnan(batch))
+        else:
+            self.assertEqual(scalar, float(batch))
+
+    def test_half_values_round_away_from_zero(self):
+        scalar = extractor.calculate_densities(0.25, None, 1000, None)
+        batch = extractor.calculate_densities_batch([0.25], [None], [1000], [None])
+        key = 'energy_density_gravimetric_wh_per_kg'
+        self.assertEqual(scalar[key], 0.3)
+        self.assert_same(scalar[key], batch[key][0])
+
+    def test_densities_match_scalar(self):
+        rng = random.Random(0)
+        cells = [
+            (round(rng.uniform(1, 100), 2), round(rng.uniform(5, 2000), 1),
+             round(rng.uniform(10, 1000), 1), round(rng.uniform(5, 500), 1))
+            for _ in range(5000)
+        ]
+        cells.append((39.33, None, 412.8, 14.4))
+        energy, power, weight, volume = (list(col) for col in zip(*cells))
+        batch = extractor.calculate_densities_batch(energy, power, weight, volume)
+        for i, cell in enumerate(cells):
+            scalar = extractor.calculate_densities(*cell)
+            for key, values in batch.items():
+                self.assert_same(scalar[key], values[i])
+
+    def test_volume_matches_scalar(self):
+        rng = random.Random(1)
+        diameters = [round(rng.uniform(10, 50), 2) for _ in range(5000)]
+        heights = [round(rng.uniform(30, 150), 2) for _ in range(5000)]
+        batch = extractor.calculate_volume_batch(
+            'cylindrical', {'diameter_mm': diameters, 'height_mm': heights}
+        )
+        for d, h, value in zip(diameters, heights, batch['value']):
+            scalar = extractor.calculate_volume(
+                'cylindrical', {'diameter_mm': d, 'height_mm': h}
+            )
+            self.assertEqual(scalar['value'], float(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Resistance unit handling: mΩ is milliohm, MΩ (megaohm) is not.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import extractor  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class ResistanceUnitTest(unittest.TestCase):
+
+    def test_milliohm_symbol_converts(self):
+        self.assertEqual(extractor.normalize_units("45mΩ", "ohm"), 0.045)
+        self.assertEqual(extractor.normalize_units("0.045Ω", "mohm"), 45.0)
+
+    def test_megaohm_is_not_read_as_milliohm(self):
+        self.assertEqual(extractor.normalize_units("5MΩ", "ohm"), 5.0)
+        self.assertEqual(extractor.normalize_units("5 MΩ", "mohm"), 5.0)
+
+    @unittest.skipIf(np is None, "numpy is required for normalize_units_bulk")
+    def test_bulk_matches_scalar(self):
+        units = ["MΩ", "mΩ", "Ω"]
+        bulk = extractor.normalize_units_bulk([5, 45, 2], "ohm", source_units=units)
+        scalar = [extractor.normalize_units(f"{v}{u}", "ohm")
+                  for v, u in zip([5, 45, 2], units)]
+        self.assertEqual(bulk.tolist(), scalar)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,8 @@ for building a Ragone plot database (Power Density vs Energy Density).
 
 Requirements:
     pip install gspread google-auth google-auth-oauthlib
+    pip install orjson  # optional, faster JSON loading
+    pip install ijson   # optional, lower memory on very large JSON files
 
 Setup:
     1. Create a Google Cloud project at https://console.cloud.google.com/
@@ -16,11 +18,50 @@ Setup:
     5. Place credentials.json in the same directory as this script
 """
 
+import io
+import os
+import sys
 import json
 import csv
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from itertools import groupby
+
+# Optional parsers are imported on first use, so --help and argument
+# errors never pay for them
+_json_loads = None
+_ijson = None  # False once ijson is known to be missing
+
+
+def _load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when installed (noticeably faster)."""
+    global _json_loads
+    if _json_loads is None:
+        try:
+            import orjson
+        except ImportError:
+            _json_loads = json.loads
+        else:
+            def _orjson_loads(data: bytes) -> Any:
+                # orjson rejects NaN/Infinity, which json.dump writes by default
+                try:
+                    return orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    return json.loads(data)
+            _json_loads = _orjson_loads
+    return _json_loads(Path(path).read_bytes())
+
+
+def _get_ijson() -> Any:
+    """Return the ijson module, or None when it is not installed."""
+    global _ijson
+    if _ijson is None:
+        try:
+            import ijson
+            _ijson = ijson
+        except ImportError:
+            _ijson = False
+    return _ijson or None
 
 
 # =============================================================================
@@ -66,6 +107,11 @@ CONFIG = {
 
     # Set to True to only generate CSV files (no Google Sheets upload)
     "csv_only": False,
+
+    # Optional JSON file caching converted rows between batch runs, so
+    # unchanged input files are not re-parsed (None disables the cache)
+    # Example: "row_cache.json" (keep it outside batch_directory)
+    "row_cache_path": None,
 }
 
 
@@ -162,6 +208,59 @@ RAGONE_COLUMNS = [
     ("confidence", "cell_info.confidence_overall", ""),
 ]
 
+# RAGONE_COLUMNS with each json_path pre-split into a key tuple, so
+# json_to_row doesn't re-split every path for every file
+_COMPILED_COLUMNS = [
+    (name, tuple(json_path.split(".")), unit)
+    for name, json_path, unit in RAGONE_COLUMNS
+]
+
+# Consecutive columns grouped by top-level key, so json_to_row looks up
+# json_data["electrical"] etc. once per group instead of once per column.
+# Each entry: (top_level_key, [remaining key tuples in column order])
+_GROUPED_COLUMNS = [
+    (top, [keys[1:] for _, keys, _ in columns])
+    for top, columns in groupby(_COMPILED_COLUMNS, key=lambda col: col[1][0])
+]
+
+# Top-level sections read by json_to_row (and the model lookup in cell_info)
+_ROW_TOP_KEYS = frozenset(top for top, _ in _GROUPED_COLUMNS)
+
+
+def _load_row_data(path: str) -> Any:
+    """
+    Load only what json_to_row needs from a JSON file.
+    
+    Top-level sections not referenced by RAGONE_COLUMNS (raw page text,
+    logs, ...) are dropped. With ijson installed the file is streamed and
+    each unused section is discarded as soon as it is parsed; otherwise the
+    file is loaded whole and trimmed straight away, so batch export does
+    not hold every file's unused sections while it collects columns.
+    
+    Args:
+        path: Path to the JSON file.
+        
+    Returns:
+        Parsed JSON data restricted to the exported sections.
+    """
+    ijson = _get_ijson()
+    if ijson is not None:
+        try:
+            with open(path, "rb") as f:
+                return {
+                    key: value
+                    for key, value in ijson.kvitems(f, "", use_float=True)
+                    if key in _ROW_TOP_KEYS
+                }
+        except ijson.JSONError:
+            # ijson rejects NaN/Infinity too; the whole-file loader does not
+            pass
+    
+    data = _load_json(path)
+    if type(data) is not dict:
+        return data
+    return {key: value for key, value in data.items() if key in _ROW_TOP_KEYS}
+
 
 def get_nested_value(data: Dict, path: str) -> Any:
     """
@@ -174,14 +273,15 @@ def get_nested_value(data: Dict, path: str) -> Any:
     Returns:
         The value at the specified path, or None if not found.
     """
-    keys = path.split(".")
     current = data
     
-    for key in keys:
-        if isinstance(current, dict) and key in current:
+    # One dict probe per level; a missing key or a non-dict value on the
+    # way down (list, str, None) ends the walk
+    try:
+        for key in path.split("."):
             current = current[key]
-        else:
-            return None
+    except (KeyError, TypeError):
+        return None
     
     return current
 
@@ -196,17 +296,47 @@ def json_to_row(json_data: Dict) -> List[Any]:
     Returns:
         List of values in the order defined by RAGONE_COLUMNS.
     """
+    if not isinstance(json_data, dict):
+        return [None] * len(_COMPILED_COLUMNS)
+    
     row = []
-    for col_name, json_path, unit in RAGONE_COLUMNS:
-        value = get_nested_value(json_data, json_path)
-        row.append(value)
+    for top, key_paths in _GROUPED_COLUMNS:
+        section = json_data.get(top)
+        if not isinstance(section, dict):
+            row.extend([None] * len(key_paths))
+            continue
+        for keys in key_paths:
+            current = section
+            for key in keys:
+                if isinstance(current, dict):
+                    current = current.get(key)
+                    if current is None:
+                        break
+                else:
+                    current = None
+                    break
+            row.append(current)
     return row
 
 
+def _render_csv_header() -> str:
+    """Render the CSV header line for RAGONE_COLUMNS (quoted, newline-terminated)."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(col[0] for col in RAGONE_COLUMNS)
+    return buffer.getvalue()
+
+
+# The header never changes, so json_to_csv writes this pre-rendered line
+_CSV_HEADER_LINE = _render_csv_header()
+
+
 def json_to_csv(json_data: Dict, output_path: Optional[str] = None) -> str:
     """
     Convert battery cell JSON to CSV format.
     
+    Values are quoted by the csv module, so fields containing commas,
+    quotes or newlines survive the round trip.
+    
     Args:
         json_data: Extracted battery cell data in JSON format.
         output_path: Optional path to write CSV file.
@@ -214,45 +344,81 @@ def json_to_csv(json_data: Dict, output_path: Optional[str] = None) -> str:
     Returns:
         CSV string representation of the data.
     """
-    headers = [col[0] for col in RAGONE_COLUMNS]
-    row = json_to_row(json_data)
-    
-    # Build CSV string
-    lines = [",".join(headers)]
-    lines.append(",".join(str(v) if v is not None else "" for v in row))
-    csv_content = "\n".join(lines)
+    buffer = io.StringIO()
+    buffer.write(_CSV_HEADER_LINE)
+    csv.writer(buffer, lineterminator="\n").writerow(
+        "" if v is None else v for v in json_to_row(json_data)
+    )
+    csv_content = buffer.getvalue()
     
     if output_path:
-        Path(output_path).write_text(csv_content)
+        # Whole file is already rendered: one binary write, no text layer
+        Path(output_path).write_bytes(csv_content.encode("utf-8"))
     
     return csv_content
 
 
-def export_to_google_sheets(
-    json_data: Dict,
-    spreadsheet_name: str,
-    credentials_path: str = "credentials.json",
-    worksheet_name: str = "Battery Cells"
-) -> Dict[str, Any]:
+# Scopes needed to open, create and edit spreadsheets
+_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+]
+
+# Authorized gspread client per credentials file:
+# path -> ((mtime_ns, size), client)
+_CLIENT_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _load_client(gspread: Any, credentials_cls: Any, credentials_path: str) -> Any:
     """
-    Export battery cell data to Google Sheets in transposed format.
+    Authorize a gspread client, reusing it while the credentials file is unchanged.
     
-    Layout:
-        - Column A: Property names (Manufacturer, Cell model, etc.)
-        - Column B: Units (mm, g, Ah, etc.)
-        - Column C onwards: Each cell's data in its own column
+    Repeated exports in one process (e.g. calling export_to_google_sheets
+    per file) skip re-reading the key file, re-parsing the RSA key and
+    setting up a new authorized session. The cache lives in memory only;
+    credentials are never written elsewhere.
     
-    This function adds a new column for each battery cell. If the worksheet
-    is empty, it will add property names and units first.
+    Args:
+        gspread: The imported gspread module.
+        credentials_cls: google.oauth2.service_account.Credentials.
+        credentials_path: Path to the service account credentials JSON file.
+        
+    Returns:
+        gspread client authorized for Sheets and Drive access.
+    """
+    stat = os.stat(credentials_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = os.path.abspath(credentials_path)
+    
+    cached = _CLIENT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    credentials = credentials_cls.from_service_account_file(
+        credentials_path,
+        scopes=_SCOPES
+    )
+    client = gspread.authorize(credentials)
+    _CLIENT_CACHE[key] = (stamp, client)
+    return client
+
+
+def _open_worksheet(
+    spreadsheet_name: str,
+    credentials_path: str,
+    worksheet_name: str
+) -> Tuple[Any, Any, bool]:
+    """
+    Authorize with Google and open (or create) the target worksheet.
     
     Args:
-        json_data: Extracted battery cell data in JSON format.
-        spreadsheet_name: Name of the Google Sheet to export to.
+        spreadsheet_name: Name of the Google Sheet to open or create.
         credentials_path: Path to the service account credentials JSON file.
-        worksheet_name: Name of the worksheet/tab to use.
+        worksheet_name: Name of the worksheet/tab to open or create.
         
     Returns:
-        Dictionary with export status and details.
+        Tuple of (spreadsheet, worksheet, created) where created is True
+        when the worksheet was just added and is therefore empty.
         
     Raises:
         ImportError: If gspread is not installed.
@@ -275,18 +441,10 @@ def export_to_google_sheets(
             "Please download service account credentials from Google Cloud Console."
         )
     
-    # Setup credentials with required scopes
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive"
-    ]
-    credentials = Credentials.from_service_account_file(
-        credentials_path, 
-        scopes=scopes
-    )
+    # Authorize with required scopes (client reused while the file is unchanged)
+    client = _load_client(gspread, Credentials, credentials_path)
     
-    # Authorize and get spreadsheet
-    client = gspread.authorize(credentials)
+    # Get spreadsheet
     
     try:
         spreadsheet = client.open(spreadsheet_name)
@@ -295,6 +453,7 @@ def export_to_google_sheets(
         spreadsheet = client.create(spreadsheet_name)
     
     # Get or create worksheet
+    created = False
     try:
         worksheet = spreadsheet.worksheet(worksheet_name)
         # Ensure worksheet has enough columns
@@ -307,90 +466,254 @@ def export_to_google_sheets(
             rows=len(RAGONE_COLUMNS) + 1,  # +1 for header row
             cols=100  # Plenty of columns for cells
         )
+        created = True
     
-    # Check current data to determine if we need to add property/unit columns
-    existing_data = worksheet.get_all_values()
-    
-    # Get property names and units
-    property_names = [col[0] for col in RAGONE_COLUMNS]
-    units = [col[2] for col in RAGONE_COLUMNS]
+    return spreadsheet, worksheet, created
+
+
+def _get_worksheet(
+    spreadsheet_name: str,
+    credentials_path: str,
+    worksheet_name: str
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Open the worksheet and read its current layout once.
     
-    # Get model name for column header
-    model = get_nested_value(json_data, "cell_info.model_number") or "Unknown"
+    The returned state tracks where the next cell column goes and which
+    models are already present, so any number of cells can be appended
+    with _append_column without re-reading the sheet.
     
-    # Check if the sheet is properly initialized with property names
-    # by checking if the first cell contains the first property name
-    sheet_initialized = False
-    if existing_data and len(existing_data) > 0 and len(existing_data[0]) > 0:
-        first_cell = existing_data[0][0] if existing_data[0] else ""
-        # Check if first cell matches first property name
-        sheet_initialized = (first_cell == property_names[0])
-    
-    if not sheet_initialized:
-        # Clear the sheet and initialize with property names and units
-        worksheet.clear()
-        
-        # Build the initial data with property names and units
-        initial_data = []
-        for prop_name, _, unit in RAGONE_COLUMNS:
-            initial_data.append([prop_name, unit])
+    Args:
+        spreadsheet_name: Name of the Google Sheet to export to.
+        credentials_path: Path to the service account credentials JSON file.
+        worksheet_name: Name of the worksheet/tab to use.
         
-        # Update the sheet with initial structure
-        worksheet.update(values=initial_data, range_name=f"A1:B{len(RAGONE_COLUMNS)}")
+    Returns:
+        Tuple of (worksheet, state) where state holds 'next_col',
+        'existing_models', 'initialized', the queued 'pending' columns
+        (starting at column 'pending_from') and the spreadsheet details
+        used in result dictionaries.
         
-        # Set the next column for cell data
-        next_col = 3  # Column C (1-indexed)
+    Raises:
+        ImportError: If gspread is not installed.
+        FileNotFoundError: If credentials file is not found.
+    """
+    spreadsheet, worksheet, created = _open_worksheet(
+        spreadsheet_name, credentials_path, worksheet_name
+    )
+    
+    # Check current data to determine if we need to add property/unit columns.
+    # A worksheet we just created is known to be empty - skip the download.
+    existing_data = [] if created else worksheet.get_all_values()
+    
+    # Check if the sheet is properly initialized with property names
+    # by checking if the first cell matches the first property name
+    initialized = bool(
+        existing_data and existing_data[0]
+        and existing_data[0][0] == RAGONE_COLUMNS[0][0]
+    )
+    
+    state = {
+        "spreadsheet_name": spreadsheet_name,
+        "worksheet_name": worksheet_name,
+        "spreadsheet_url": spreadsheet.url,
+        "initialized": initialized,
+        # Stray content in an uninitialized sheet is cleared on first flush
+        "clear_first": not initialized and bool(existing_data),
+        # Queued column values, left to right from column pending_from
+        "pending": [],
+    }
+    
+    if initialized:
+        # Models live in row 2 (index 1), from column C (index 2) onwards
+        model_row = existing_data[1] if len(existing_data) > 1 else []
+        state["existing_models"] = set(model_row[2:])
+        # get_all_values() pads every row to the sheet's data width,
+        # so row 1 is enough to find the next empty column
+        state["next_col"] = max(len(existing_data[0]) + 1, 3)
+        state["pending_from"] = state["next_col"]
     else:
-        # Check for duplicate: see if model already exists in the sheet
-        # Model is typically in row 2 (index 1) - check all columns from C onwards
-        if len(existing_data) > 1:  # Has at least 2 rows (model row exists)
-            model_row = existing_data[1] if len(existing_data) > 1 else []
-            # Check columns C onwards (index 2+)
-            existing_models = model_row[2:] if len(model_row) > 2 else []
-            if model in existing_models:
-                return {
-                    "status": "skipped",
-                    "reason": "duplicate",
-                    "model": model,
-                    "message": f"Model '{model}' already exists in sheet",
-                    "spreadsheet_url": spreadsheet.url
-                }
+        # Property names (A) and units (B) go out with the first flush,
+        # directly left of the first cell column
+        state["pending"].append([col[0] for col in RAGONE_COLUMNS])
+        state["pending"].append([col[2] for col in RAGONE_COLUMNS])
+        state["pending_from"] = 1
+        state["existing_models"] = set()
+        state["next_col"] = 3  # Column C (1-indexed)
+    
+    return worksheet, state
+
+
+def _column_values(json_data: Dict) -> List[str]:
+    """
+    Convert battery cell JSON data to the cell values of one sheet column.
+    
+    Args:
+        json_data: Extracted battery cell data in JSON format.
         
-        # Find the next empty column for new cell data
-        # Check number of columns with data in first row
-        max_cols = max(len(row) for row in existing_data) if existing_data else 2
-        next_col = max_cols + 1
-        # Ensure we start at column C minimum
-        if next_col < 3:
-            next_col = 3
+    Returns:
+        List of strings in RAGONE_COLUMNS order, "" for missing values.
+    """
+    return [str(v) if v is not None else "" for v in json_to_row(json_data)]
+
+
+def _append_column(
+    state: Dict[str, Any],
+    json_data: Optional[Dict],
+    col_data: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Queue one battery cell as the next column, skipping duplicate models.
     
-    # Convert JSON to column data
-    cell_values = json_to_row(json_data)
+    Nothing is sent to Google Sheets until _flush_columns is called.
     
-    # Add model name as header in row 0 (we'll insert a header row concept)
-    # For simplicity, we'll use the model name in the first cell value position
-    # Actually, let's put the cell data starting from row 1
+    Args:
+        state: Worksheet state from _get_worksheet (updated in place).
+        json_data: Extracted battery cell data in JSON format.
+        col_data: Precomputed _column_values output; when given,
+                  json_data is not used.
+        
+    Returns:
+        Dictionary with export status and details.
+    """
+    # Get model name for column header
+    if col_data is None:
+        model = get_nested_value(json_data, "cell_info.model_number") or "Unknown"
+    else:
+        model = col_data[1] or "Unknown"
     
-    # Build column data: each property value goes in a row
-    col_data = [[str(v) if v is not None else ""] for v in cell_values]
+    if model in state["existing_models"]:
+        return {
+            "status": "skipped",
+            "reason": "duplicate",
+            "model": model,
+            "message": f"Model '{model}' already exists in sheet",
+            "spreadsheet_url": state["spreadsheet_url"]
+        }
     
-    # Convert column number to letter (A=1, B=2, C=3, etc.)
-    col_letter = _col_num_to_letter(next_col)
+    # Build column data: each property value goes in a row
+    if col_data is None:
+        col_data = _column_values(json_data)
     
-    # Update the column with cell data
-    cell_range = f"{col_letter}1:{col_letter}{len(RAGONE_COLUMNS)}"
-    worksheet.update(values=col_data, range_name=cell_range)
+    next_col = state["next_col"]
+    state["pending"].append(col_data)
+    # Track what the sheet will hold so later cells dedupe against it
+    state["existing_models"].add(col_data[1])
+    state["next_col"] = next_col + 1
     
     return {
         "status": "success",
-        "spreadsheet_name": spreadsheet_name,
-        "worksheet_name": worksheet_name,
+        "spreadsheet_name": state["spreadsheet_name"],
+        "worksheet_name": state["worksheet_name"],
         "model_added": model,
         "column_number": next_col,
-        "spreadsheet_url": spreadsheet.url
+        "spreadsheet_url": state["spreadsheet_url"]
     }
 
 
+# Cell columns sent per update request; large batches are split so no
+# single request approaches the Sheets API payload limit
+_MAX_COLUMNS_PER_UPDATE = 1000
+
+
+def _flush_columns(worksheet: Any, state: Dict[str, Any]) -> None:
+    """
+    Write all queued columns to the worksheet in as few updates as possible.
+    
+    Queued columns are always adjacent, so they are sent as one
+    rectangular range (e.g. C1:F38) rather than one range per column;
+    only very large batches are split into several ranges.
+    
+    If an update fails, the columns already written are removed from the
+    queue before the error propagates, so state["pending"] then holds
+    only the columns that never reached the sheet.
+    
+    Args:
+        worksheet: gspread worksheet from _get_worksheet.
+        state: Worksheet state holding the queued columns.
+    """
+    pending = state["pending"]
+    if not pending:
+        return
+    
+    if state["clear_first"]:
+        # Clear any stray content before writing property names and units
+        worksheet.clear()
+        state["clear_first"] = False
+    state["initialized"] = True
+    
+    first_col = state["pending_from"]
+    last_col = first_col + len(pending) - 1
+    if last_col > worksheet.col_count:
+        worksheet.resize(cols=last_col)
+    
+    # Transpose queued columns into the row-major layout the API expects,
+    # in slices that keep each request well under the API payload limit
+    num_rows = len(RAGONE_COLUMNS)
+    for start in range(0, len(pending), _MAX_COLUMNS_PER_UPDATE):
+        chunk = pending[start:start + _MAX_COLUMNS_PER_UPDATE]
+        chunk_first = first_col + start
+        chunk_last = chunk_first + len(chunk) - 1
+        cell_range = (f"{_col_num_to_letter(chunk_first)}1:"
+                      f"{_col_num_to_letter(chunk_last)}{num_rows}")
+        try:
+            worksheet.update(values=[list(row) for row in zip(*chunk)],
+                             range_name=cell_range)
+        except Exception:
+            state["pending"] = pending[start:]
+            state["pending_from"] = chunk_first
+            raise
+    
+    state["pending"] = []
+    state["pending_from"] = state["next_col"]
+
+
+def export_to_google_sheets(
+    json_data: Dict,
+    spreadsheet_name: str,
+    credentials_path: str = "credentials.json",
+    worksheet_name: str = "Battery Cells"
+) -> Dict[str, Any]:
+    """
+    Export battery cell data to Google Sheets in transposed format.
+    
+    Layout:
+        - Column A: Property names (Manufacturer, Cell model, etc.)
+        - Column B: Units (mm, g, Ah, etc.)
+        - Column C onwards: Each cell's data in its own column
+    
+    This function adds a new column for each battery cell. If the worksheet
+    is empty, it will add property names and units first.
+    
+    Args:
+        json_data: Extracted battery cell data in JSON format.
+        spreadsheet_name: Name of the Google Sheet to export to.
+        credentials_path: Path to the service account credentials JSON file.
+        worksheet_name: Name of the worksheet/tab to use.
+        
+    Returns:
+        Dictionary with export status and details.
+        
+    Raises:
+        ImportError: If gspread is not installed.
+        FileNotFoundError: If credentials file is not found.
+    """
+    worksheet, state = _get_worksheet(
+        spreadsheet_name, credentials_path, worksheet_name
+    )
+    result = _append_column(state, json_data)
+    _flush_columns(worksheet, state)
+    return result
+
+
+# Column letters A..ZZ (columns 1..702), built once at import
+_COL_LETTERS = [chr(65 + i) for i in range(26)] + [
+    chr(65 + first) + chr(65 + second)
+    for first in range(26)
+    for second in range(26)
+]
+
+
 def _col_num_to_letter(col_num: int) -> str:
     """
     Convert a column number to Excel-style column letter (1=A, 2=B, ..., 27=AA).
@@ -401,6 +724,10 @@ def _col_num_to_letter(col_num: int) -> str:
     Returns:
         Column letter(s) as string.
     """
+    if 0 < col_num <= len(_COL_LETTERS):
+        return _COL_LETTERS[col_num - 1]
+    
+    # Beyond ZZ (or invalid input): build the letters arithmetically
     result = ""
     while col_num > 0:
         col_num, remainder = divmod(col_num - 1, 26)
@@ -408,20 +735,106 @@ def _col_num_to_letter(col_num: int) -> str:
     return result
 
 
+# Column layout stored with the row cache; a cache written for a different
+# RAGONE_COLUMNS layout is ignored
+_ROW_CACHE_LAYOUT = [[name, path] for name, path, _ in RAGONE_COLUMNS]
+
+
+def _load_row_cache(cache_path: str) -> Dict[str, Any]:
+    """
+    Load the batch row cache, starting empty if it is missing or stale.
+    
+    The cache is a JSON object mapping each input file's absolute path to
+    [mtime_ns, size, column values]. It is discarded as a whole when the
+    column layout has changed since it was written.
+    
+    Args:
+        cache_path: Path to the row cache JSON file.
+        
+    Returns:
+        Dictionary of cached entries keyed by absolute input path.
+    """
+    try:
+        cached = _load_json(cache_path)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict) or cached.get("layout") != _ROW_CACHE_LAYOUT:
+        return {}
+    entries = cached.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_row_cache(cache_path: str, entries: Dict[str, Any]) -> None:
+    """
+    Write the batch row cache atomically (temp file, then rename).
+    
+    Args:
+        cache_path: Path to the row cache JSON file.
+        entries: Cached entries keyed by absolute input path.
+    """
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"layout": _ROW_CACHE_LAYOUT, "entries": entries}, f)
+    os.replace(tmp_path, cache_path)
+
+
+def _try_load_column(
+    json_file: str,
+    row_cache: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[List[str]], Optional[str]]:
+    """
+    Load a JSON file as sheet column values, capturing any error as text.
+    
+    With a row cache, files whose mtime and size match their cached entry
+    are not read at all; other files are parsed and their entry refreshed.
+    
+    Args:
+        json_file: Path to the JSON file.
+        row_cache: Entries from _load_row_cache (updated in place), or None.
+        
+    Returns:
+        Tuple of (column values, None) on success or (None, error message)
+        on failure.
+    """
+    try:
+        if row_cache is None:
+            return _column_values(_load_row_data(json_file)), None
+        
+        stat = os.stat(json_file)
+        key = os.path.abspath(json_file)
+        cached = row_cache.get(key)
+        if (cached is not None
+                and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size):
+            return cached[2], None
+        
+        col_data = _column_values(_load_row_data(json_file))
+        row_cache[key] = [stat.st_mtime_ns, stat.st_size, col_data]
+        return col_data, None
+    except Exception as e:
+        return None, str(e)
+
+
 def batch_export_to_sheets(
     json_files: List[str],
     spreadsheet_name: str,
     credentials_path: str = "credentials.json",
-    worksheet_name: str = "Battery Cells"
+    worksheet_name: str = "Battery Cells",
+    row_cache_path: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Export multiple battery cell JSON files to Google Sheets.
     
+    Authorizes and reads the worksheet once, assigns columns and checks
+    duplicates in memory, then writes every new column as one range
+    update instead of one round-trip per file.
+    
     Args:
         json_files: List of paths to JSON files to export.
         spreadsheet_name: Name of the Google Sheet to export to.
         credentials_path: Path to the service account credentials JSON file.
         worksheet_name: Name of the worksheet/tab to use.
+        row_cache_path: Optional JSON file caching converted rows between
+                        runs; unchanged input files are not re-parsed.
         
     Returns:
         Dictionary with batch export status and summary.
@@ -436,32 +849,78 @@ def batch_export_to_sheets(
         "models_skipped": []
     }
     
-    for json_file in json_files:
+    row_cache = _load_row_cache(row_cache_path) if row_cache_path else None
+    
+    # Parse every file up front so a bad file only fails itself. Reads are
+    # I/O-bound, so a thread pool overlaps them; results keep file order.
+    if len(json_files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+            parsed = list(executor.map(
+                _try_load_column, json_files, [row_cache] * len(json_files)
+            ))
+    else:
+        parsed = [_try_load_column(json_file, row_cache) for json_file in json_files]
+    
+    if row_cache is not None:
         try:
-            with open(json_file, "r") as f:
-                json_data = json.load(f)
-            
-            result = export_to_google_sheets(
-                json_data,
-                spreadsheet_name,
-                credentials_path,
-                worksheet_name
-            )
-            
-            # Handle different result statuses
-            if result.get("status") == "skipped":
-                results["skipped"] += 1
-                results["models_skipped"].append(result["model"])
-            else:
-                results["success"] += 1
-                results["models_added"].append(result["model_added"])
-            
-        except Exception as e:
+            _save_row_cache(row_cache_path, row_cache)
+        except OSError as e:
+            print(f"Warning: could not write row cache {row_cache_path}: {e}")
+    
+    loaded = []
+    for json_file, (col_data, error) in zip(json_files, parsed):
+        if error is not None:
+            results["failed"] += 1
+            results["errors"].append({
+                "file": json_file,
+                "error": error
+            })
+        else:
+            loaded.append((json_file, col_data))
+    
+    if not loaded:
+        return results
+    
+    try:
+        worksheet, state = _get_worksheet(
+            spreadsheet_name, credentials_path, worksheet_name
+        )
+    except Exception as e:
+        for json_file, _ in loaded:
             results["failed"] += 1
             results["errors"].append({
                 "file": json_file,
                 "error": str(e)
             })
+        return results
+    
+    pending = []
+    for json_file, col_data in loaded:
+        result = _append_column(state, None, col_data)
+        if result["status"] == "skipped":
+            results["skipped"] += 1
+            results["models_skipped"].append(result["model"])
+        else:
+            pending.append((json_file, result["model_added"]))
+    
+    try:
+        _flush_columns(worksheet, state)
+    except Exception as e:
+        # Earlier range updates may have succeeded; only the cells still
+        # queued (always the last ones) failed to reach the sheet
+        written = max(0, len(pending) - len(state["pending"]))
+        for json_file, _ in pending[written:]:
+            results["failed"] += 1
+            results["errors"].append({
+                "file": json_file,
+                "error": str(e)
+            })
+        pending = pending[:written]
+    
+    for _, model in pending:
+        results["success"] += 1
+        results["models_added"].append(model)
     
     return results
 
@@ -490,6 +949,7 @@ def run_from_config() -> None:
     credentials_path = CONFIG.get("credentials_path",
                                    "battery-cell-database-credentials.json")
     csv_only = CONFIG.get("csv_only", False)
+    row_cache_path = CONFIG.get("row_cache_path")
 
     # Validate configuration
     if not json_file and not batch_dir:
@@ -508,15 +968,41 @@ def run_from_config() -> None:
     # Run in batch mode if batch_directory is set
     if batch_dir:
         _run_batch_mode(batch_dir, spreadsheet_name, worksheet_name,
-                        credentials_path, csv_only)
+                        credentials_path, csv_only, row_cache_path)
     else:
         _run_single_file_mode(json_file, spreadsheet_name, worksheet_name,
                               credentials_path, csv_only)
 
 
+# Below this many files, process start-up costs more than it saves
+_CSV_POOL_MIN_FILES = 32
+
+# Batch directory filter: JSON inputs, minus credentials and schema files
+_JSON_SUFFIX = ".json"
+_EXCLUDED_SUFFIXES = ("-credentials.json", "_schema.json")
+
+
+def _json_file_to_csv(json_file: str) -> str:
+    """
+    Convert one JSON file to a CSV in the current directory.
+    
+    Module-level so ProcessPoolExecutor can pickle it.
+    
+    Args:
+        json_file: Path to the JSON file.
+        
+    Returns:
+        Path of the CSV file written.
+    """
+    data = _load_row_data(json_file)
+    csv_path = Path(json_file).stem + ".csv"
+    json_to_csv(data, csv_path)
+    return csv_path
+
+
 def _run_batch_mode(batch_dir: str, spreadsheet_name: str,
                     worksheet_name: str, credentials_path: str,
-                    csv_only: bool) -> None:
+                    csv_only: bool, row_cache_path: Optional[str] = None) -> None:
     """
     Process all JSON files in a directory.
 
@@ -526,17 +1012,31 @@ def _run_batch_mode(batch_dir: str, spreadsheet_name: str,
         worksheet_name: Name of the worksheet tab.
         credentials_path: Path to credentials JSON file.
         csv_only: If True, only generate CSV files.
+        row_cache_path: Optional row cache file for Google Sheets exports.
     """
-    batch_path = Path(batch_dir)
-    if not batch_path.exists():
+    # Find all JSON files (exclude config/schema files) in one directory
+    # pass; scandir's own error doubles as the existence check
+    try:
+        with os.scandir(batch_dir) as entries:
+            json_files = [
+                entry.path for entry in entries
+                if entry.name.endswith(_JSON_SUFFIX)
+                and not entry.name.endswith(_EXCLUDED_SUFFIXES)
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
         print(f"Error: Directory not found: {batch_dir}")
         return
+    except NotADirectoryError:
+        json_files = []
 
-    # Find all JSON files (exclude config/schema files)
-    json_files = [
-        str(f) for f in batch_path.glob("*.json")
-        if not f.name.endswith(("-credentials.json", "_schema.json"))
-    ]
+    # A row cache stored inside the batch directory is not a cell file
+    if row_cache_path:
+        cache_abspath = os.path.abspath(row_cache_path)
+        json_files = [
+            json_file for json_file in json_files
+            if os.path.abspath(json_file) != cache_abspath
+        ]
 
     if not json_files:
         print(f"No JSON files found in: {batch_dir}")
@@ -545,13 +1045,17 @@ def _run_batch_mode(batch_dir: str, spreadsheet_name: str,
     print(f"Found {len(json_files)} JSON file(s) to process...")
 
     if csv_only:
-        # Generate CSV for each file
-        for json_file in json_files:
-            with open(json_file, "r") as f:
-                data = json.load(f)
-            csv_path = Path(json_file).stem + ".csv"
-            json_to_csv(data, csv_path)
-            print(f"  CSV exported: {csv_path}")
+        # Generate CSV for each file; files are independent, so large
+        # batches are spread across all cores
+        if len(json_files) >= _CSV_POOL_MIN_FILES:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor() as executor:
+                for csv_path in executor.map(_json_file_to_csv, json_files,
+                                             chunksize=16):
+                    print(f"  CSV exported: {csv_path}")
+        else:
+            for json_file in json_files:
+                print(f"  CSV exported: {_json_file_to_csv(json_file)}")
         print(f"\nTotal: {len(json_files)} CSV files generated")
     else:
         # Batch export to Google Sheets
@@ -559,7 +1063,8 @@ def _run_batch_mode(batch_dir: str, spreadsheet_name: str,
             json_files,
             spreadsheet_name,
             credentials_path,
-            worksheet_name
+            worksheet_name,
+            row_cache_path
         )
 
         print(f"\n=== Batch Export Complete ===")
@@ -602,8 +1107,7 @@ def _run_single_file_mode(json_file: str, spreadsheet_name: str,
         print(f"Error: File not found: {json_file}")
         return
 
-    with open(json_file, "r") as f:
-        data = json.load(f)
+    data = _load_row_data(json_file)
 
     if csv_only:
         # Generate CSV output
@@ -622,66 +1126,156 @@ def _run_single_file_mode(json_file: str, spreadsheet_name: str,
         print(f"Spreadsheet URL: {result['spreadsheet_url']}")
 
 
+_USAGE = """\
+usage: sheets_exporter.py [-h] [--batch-dir BATCH_DIR] [--sheet SHEET]
+                          [--credentials CREDENTIALS] [--worksheet WORKSHEET]
+                          [--csv-only] [--row-cache ROW_CACHE]
+                          [json_file]
+"""
+
+_HELP = _USAGE + """
+Export battery cell data to Google Sheets
+
+positional arguments:
+  json_file             Path to the JSON file with extracted battery data
+
+options:
+  -h, --help            show this help message and exit
+  --batch-dir BATCH_DIR
+                        Path to directory containing JSON files to batch
+                        process
+  --sheet SHEET         Name of the Google Sheet (default: cell-data-sheet)
+  --credentials CREDENTIALS
+                        Path to service account credentials
+  --worksheet WORKSHEET
+                        Name of worksheet tab (default: Battery Cells)
+  --csv-only            Only generate CSV, don't upload to Sheets
+  --row-cache ROW_CACHE
+                        JSON file caching converted rows between batch runs
+"""
+
+# Parsed argument defaults (also used by the single-file fast path)
+_CLI_DEFAULTS = {
+    "json_file": None,
+    "batch_dir": None,
+    "sheet": "cell-data-sheet",
+    "credentials": "battery-cell-database-credentials.json",
+    "worksheet": "Battery Cells",
+    "csv_only": False,
+    "row_cache": None,
+}
+
+# Options that take a value: flag -> key in the parsed arguments
+_VALUE_OPTIONS = {
+    "--batch-dir": "batch_dir",
+    "--sheet": "sheet",
+    "--credentials": "credentials",
+    "--worksheet": "worksheet",
+    "--row-cache": "row_cache",
+}
+
+# getopt long option spec ("name=" takes a value)
+_LONG_OPTIONS = [flag[2:] + "=" for flag in _VALUE_OPTIONS] + ["csv-only", "help"]
+
+
+def _cli_error(message: str) -> None:
+    """
+    Print usage and an error message to stderr and exit with status 2.
+
+    Args:
+        message: Error description shown after the usage text.
+    """
+    sys.stderr.write(f"{_USAGE}sheets_exporter.py: error: {message}\n")
+    sys.exit(2)
+
+
+def _parse_argv(argv: List[str]) -> Dict[str, Any]:
+    """
+    Parse command-line arguments with getopt instead of argparse.
+
+    Accepts the same interface argparse used to provide: one optional
+    positional json_file, ``--flag value`` / ``--flag=value`` for the value
+    options (unique prefixes allowed), ``--csv-only`` and ``-h/--help``.
+
+    Args:
+        argv: Arguments after the script name (sys.argv[1:]).
+
+    Returns:
+        Dictionary with json_file, batch_dir, sheet, credentials,
+        worksheet, csv_only and row_cache keys.
+    """
+    import getopt
+
+    try:
+        opts, positional = getopt.gnu_getopt(argv, "h", _LONG_OPTIONS)
+    except getopt.GetoptError as e:
+        flag = f"--{e.opt}" if len(e.opt) > 1 else f"-{e.opt}"
+        if "requires argument" in e.msg:
+            _cli_error(f"argument {flag}: expected one argument")
+        elif "unique prefix" in e.msg:
+            _cli_error(f"ambiguous option: {flag}")
+        elif "must not have an argument" in e.msg:
+            _cli_error(f"argument {flag}: ignored explicit argument")
+        _cli_error(f"unrecognized arguments: {flag}")
+
+    # getopt takes the next argument as a value even when it is another
+    # flag; argparse rejected that (the explicit --flag=--value is fine)
+    for arg, following in zip(argv, argv[1:]):
+        if arg == "--":
+            break
+        if arg.startswith("--") and "=" not in arg and following.startswith("--"):
+            name = arg[2:]
+            matches = ([opt for opt in _LONG_OPTIONS if opt.rstrip("=") == name]
+                       or [opt for opt in _LONG_OPTIONS if opt.startswith(name)])
+            if len(matches) == 1 and matches[0].endswith("="):
+                _cli_error(f"argument --{matches[0][:-1]}: expected one argument")
+
+    args = dict(_CLI_DEFAULTS)
+    for flag, value in opts:
+        if flag in ("-h", "--help"):
+            sys.stdout.write(_HELP)
+            sys.exit(0)
+        if flag == "--csv-only":
+            args["csv_only"] = True
+        else:
+            args[_VALUE_OPTIONS[flag]] = value
+
+    if len(positional) > 1:
+        _cli_error(f"unrecognized arguments: {' '.join(positional[1:])}")
+    if positional:
+        args["json_file"] = positional[0]
+
+    return args
+
+
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
 
 if __name__ == "__main__":
-    import argparse
-    import sys
-
     # Check if any command-line arguments were provided (besides script name)
     if len(sys.argv) == 1:
         # No CLI arguments - use CONFIG values
         print("Running with CONFIG settings (no command-line arguments)...\n")
         run_from_config()
+    elif len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        # Common `sheets_exporter.py file.json` case - no flags to parse
+        _run_single_file_mode(sys.argv[1], _CLI_DEFAULTS["sheet"],
+                              _CLI_DEFAULTS["worksheet"],
+                              _CLI_DEFAULTS["credentials"],
+                              _CLI_DEFAULTS["csv_only"])
     else:
-        # CLI arguments provided - use argparse
-        parser = argparse.ArgumentParser(
-            description="Export battery cell data to Google Sheets"
-        )
-        parser.add_argument(
-            "json_file",
-            nargs="?",
-            default=None,
-            help="Path to the JSON file with extracted battery data"
-        )
-        parser.add_argument(
-            "--batch-dir",
-            dest="batch_dir",
-            help="Path to directory containing JSON files to batch process"
-        )
-        parser.add_argument(
-            "--sheet",
-            default="cell-data-sheet",
-            help="Name of the Google Sheet (default: cell-data-sheet)"
-        )
-        parser.add_argument(
-            "--credentials",
-            default="battery-cell-database-credentials.json",
-            help="Path to service account credentials"
-        )
-        parser.add_argument(
-            "--worksheet",
-            default="Battery Cells",
-            help="Name of worksheet tab (default: Battery Cells)"
-        )
-        parser.add_argument(
-            "--csv-only",
-            action="store_true",
-            help="Only generate CSV, don't upload to Sheets"
-        )
-
-        args = parser.parse_args()
+        args = _parse_argv(sys.argv[1:])
 
         # Validate arguments
-        if args.batch_dir is None and args.json_file is None:
-            parser.error("Either json_file or --batch-dir must be provided")
+        if args["batch_dir"] is None and args["json_file"] is None:
+            _cli_error("Either json_file or --batch-dir must be provided")
 
-        if args.batch_dir:
-            _run_batch_mode(args.batch_dir, args.sheet, args.worksheet,
-                           args.credentials, args.csv_only)
+        if args["batch_dir"]:
+            _run_batch_mode(args["batch_dir"], args["sheet"], args["worksheet"],
+                            args["credentials"], args["csv_only"],
+                            args["row_cache"])
         else:
-            _run_single_file_mode(args.json_file, args.sheet, args.worksheet,
-                                  args.credentials, args.csv_only)
-
+            _run_single_file_mode(args["json_file"], args["sheet"],
+                                  args["worksheet"], args["credentials"],
+                                  args["csv_only"])
@@ -0,0 +1,30 @@
+"""
+json_to_row accepts any dict, including subclasses such as OrderedDict.
+"""
+
+import json
+import sys
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sheets_exporter  # noqa: E402
+
+DOCUMENT = '{"cell_info": {"manufacturer": "Acme", "model_number": "X1"}}'
+
+
+class DictSubclassRowTest(unittest.TestCase):
+
+    def test_ordered_dict_matches_plain_dict(self):
+        plain = sheets_exporter.json_to_row(json.loads(DOCUMENT))
+        ordered = sheets_exporter.json_to_row(
+            json.loads(DOCUMENT, object_pairs_hook=OrderedDict)
+        )
+        self.assertEqual(ordered, plain)
+        self.assertEqual(ordered[:2], ["Acme", "X1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
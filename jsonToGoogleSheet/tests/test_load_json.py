@@ -0,0 +1,51 @@
+"""
+JSON loading must accept what json.dump writes, whichever parser is installed.
+
+json.dump emits NaN / Infinity for non-finite floats by default; orjson
+and ijson reject those tokens, so the loaders fall back to the stdlib.
+"""
+
+import csv
+import io
+import math
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sheets_exporter  # noqa: E402
+
+NAN_DOCUMENT = (
+    '{"cell_info": {"manufacturer": "Acme", "model_number": "X1"},'
+    ' "derived_properties": {"energy_wh": NaN}, "raw": Infinity}'
+)
+
+
+class NonFiniteJsonTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            f.write(NAN_DOCUMENT)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_load_json_accepts_nan(self):
+        data = sheets_exporter._load_json(self.path)
+        self.assertTrue(math.isnan(data["derived_properties"]["energy_wh"]))
+        self.assertEqual(data["raw"], math.inf)
+
+    def test_row_data_exports_to_csv(self):
+        data = sheets_exporter._load_row_data(self.path)
+        rows = list(csv.reader(io.StringIO(sheets_exporter.json_to_csv(data))))
+        row = dict(zip(rows[0], rows[1]))
+        self.assertEqual(row["model"], "X1")
+        self.assertEqual(row["manufacturer"], "Acme")
+
+
+if __name__ == "__main__":
+    unittest.main()